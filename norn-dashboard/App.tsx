@@ -8,9 +8,97 @@ import { AuditLogView } from './components/AuditLogView';
 import { ConfigView } from './components/ConfigView';
 import { BrowserAuditView } from './components/BrowserAuditView';
 import { SwarmView } from './components/SwarmView';
-import { api, SessionData } from './services/api';
+import { api, SessionData, SessionStep } from './services/api';
 import { Session, QualityLevel, IssueType, AgentStep, SessionIssueDetail } from './types';
 
+// Convert one backend step into timeline entries (call, result, Norn check)
+const convertStep = (step: SessionStep, stepIdx: number): AgentStep[] => {
+  const out: AgentStep[] = [];
+  // Handle null scores — null means "not yet evaluated"
+  const secScore = step.security_score;
+  const relScore = step.relevance_score;
+  const riskScore = secScore != null ? Math.max(0, 100 - secScore) : null;
+
+  // Pure-reasoning agent step (no tool calls — e.g. Thinker)
+  if (step.tool_name === 'ai_reasoning') {
+    out.push({
+      id: step.step_id || String(stepIdx),
+      timestamp: step.timestamp,
+      type: 'agent_thought',
+      content: step.tool_result || '',
+      metadata: { toolName: 'ai_reasoning' }
+    });
+  } else {
+    // Tool call step
+    out.push({
+      id: step.step_id || String(stepIdx),
+      timestamp: step.timestamp,
+      type: 'tool_call',
+      content: `${step.tool_name}(${step.tool_input || ''})`,
+      metadata: {
+        toolName: step.tool_name,
+        riskScore,
+      }
+    });
+
+    // Tool result step
+    if (step.tool_result) {
+      out.push({
+        id: `${step.step_id || stepIdx}-result`,
+        timestamp: step.timestamp,
+        type: 'tool_result',
+        content: step.tool_result,
+        metadata: {
+          toolName: step.tool_name,
+        }
+      });
+    }
+  }
+
+  // Norn check step (security/relevance evaluation)
+  if (step.reasoning) {
+    const hasSecurityIssue = riskScore != null && riskScore > 0;
+    const hasRelevanceIssue = relScore != null && relScore < 50;
+    const status = step.status || 'SUCCESS';
+
+    let checkContent = '';
+    if (status === 'IRRELEVANT' || hasRelevanceIssue) {
+      checkContent = `Task Drift: Relevance ${relScore != null ? relScore + '%' : 'N/A'}. ${step.reasoning}`;
+    } else if (hasSecurityIssue) {
+      checkContent = `Security Alert: Score ${secScore != null ? secScore + '%' : 'N/A'}. ${step.reasoning}`;
+    } else if (relScore == null || secScore == null) {
+      checkContent = `Evaluating: ${step.reasoning}`;
+    } else {
+      checkContent = `Monitor: Step OK. Relevance: ${relScore}%, Security: ${secScore}%`;
+    }
+
+    const shadowVerification = step.metadata?.shadow_verification
+      ? {
+          verified: step.metadata.shadow_verification.verified,
+          verificationResult: step.metadata.shadow_verification.verification_result as 'VERIFIED' | 'SECURITY_CONCERN' | 'UNAVAILABLE',
+          verificationMethod: step.metadata.shadow_verification.verification_method,
+          securityScore: step.metadata.shadow_verification.security_score ?? null,
+          securityIssues: step.metadata.shadow_verification.security_issues || [],
+          details: step.metadata.shadow_verification.details || '',
+          url: step.metadata.shadow_verification.url,
+        }
+      : undefined;
+
+    out.push({
+      id: `${step.step_id || stepIdx}-check`,
+      timestamp: step.timestamp,
+      type: 'norn_check',
+      content: checkContent,
+      metadata: {
+        riskScore,
+        shadowVerification,
+      }
+    });
+  }
+
+  return out;
+};
+
 const App: React.FC = () => {
   const [currentView, setCurrentView] = useState('dashboard');
   const [selectedSessionId, setSelectedSessionId] = useState<string | null>(null);
@@ -45,6 +133,23 @@ const App: React.FC = () => {
                 new Date(b.startTime).getTime() - new Date(a.startTime).getTime()
               );
             });
+          } else if (data.type === 'sessions_diff') {
+            // Periodic diff: changed sessions replace their old copies, removed ones drop out
+            setSessions(prev => {
+              const changed = convertSessionData(data.sessions);
+              const replaced = new Set<string>([...data.removed, ...changed.map(s => s.id)]);
+              return [...changed, ...prev.filter(s => !replaced.has(s.id))].sort((a, b) =>
+                new Date(b.startTime).getTime() - new Date(a.startTime).getTime()
+              );
+            });
+            if (data.agents) setAgents(data.agents);
+          } else if (data.type === 'session_step_append') {
+            // Incremental step — sessions not loaded yet arrive with the next snapshot
+            setSessions(prev => prev.map(s =>
+              s.id === data.session_id
+                ? { ...s, status: 'active' as const, steps: [...s.steps, ...convertStep(data.step, data.total_steps)] }
+                : s
+            ));
           }
         },
         () => {
@@ -137,93 +242,7 @@ const App: React.FC = () => {
       const issueTypes = issueDetails.map(i => i.issueType);
 
       // Convert steps into rich timeline entries
-      const steps: AgentStep[] = [];
-      let stepIdx = 0;
-
-      for (const step of (s.steps || [])) {
-        stepIdx++;
-        // Handle null scores — null means "not yet evaluated"
-        const secScore = step.security_score;
-        const relScore = step.relevance_score;
-        const riskScore = secScore != null ? Math.max(0, 100 - secScore) : null;
-
-        // Pure-reasoning agent step (no tool calls — e.g. Thinker)
-        if (step.tool_name === 'ai_reasoning') {
-          steps.push({
-            id: step.step_id || String(stepIdx),
-            timestamp: step.timestamp,
-            type: 'agent_thought',
-            content: step.tool_result || '',
-            metadata: { toolName: 'ai_reasoning' }
-          });
-        } else {
-        // Tool call step
-        steps.push({
-          id: step.step_id || String(stepIdx),
-          timestamp: step.timestamp,
-          type: 'tool_call',
-          content: `${step.tool_name}(${step.tool_input || ''})`,
-          metadata: {
-            toolName: step.tool_name,
-            riskScore,
-          }
-        });
-
-        // Tool result step
-        if (step.tool_result) {
-          steps.push({
-            id: `${step.step_id || stepIdx}-result`,
-            timestamp: step.timestamp,
-            type: 'tool_result',
-            content: step.tool_result,
-            metadata: {
-              toolName: step.tool_name,
-            }
-          });
-        }
-        } // end non-reasoning branch
-
-        // Norn check step (security/relevance evaluation)
-        if (step.reasoning) {
-          const hasSecurityIssue = riskScore != null && riskScore > 0;
-          const hasRelevanceIssue = relScore != null && relScore < 50;
-          const status = step.status || 'SUCCESS';
-
-          let checkContent = '';
-          if (status === 'IRRELEVANT' || hasRelevanceIssue) {
-            checkContent = `Task Drift: Relevance ${relScore != null ? relScore + '%' : 'N/A'}. ${step.reasoning}`;
-          } else if (hasSecurityIssue) {
-            checkContent = `Security Alert: Score ${secScore != null ? secScore + '%' : 'N/A'}. ${step.reasoning}`;
-          } else if (relScore == null || secScore == null) {
-            checkContent = `Evaluating: ${step.reasoning}`;
-          } else {
-            checkContent = `Monitor: Step OK. Relevance: ${relScore}%, Security: ${secScore}%`;
-          }
-
-          const shadowVerification = step.metadata?.shadow_verification
-            ? {
-                verified: step.metadata.shadow_verification.verified,
-                verificationResult: step.metadata.shadow_verification.verification_result as 'VERIFIED' | 'SECURITY_CONCERN' | 'UNAVAILABLE',
-                verificationMethod: step.metadata.shadow_verification.verification_method,
-                securityScore: step.metadata.shadow_verification.security_score ?? null,
-                securityIssues: step.metadata.shadow_verification.security_issues || [],
-                details: step.metadata.shadow_verification.details || '',
-                url: step.metadata.shadow_verification.url,
-              }
-            : undefined;
-
-          steps.push({
-            id: `${step.step_id || stepIdx}-check`,
-            timestamp: step.timestamp,
-            type: 'norn_check',
-            content: checkContent,
-            metadata: {
-              riskScore,
-              shadowVerification,
-            }
-          });
-        }
-      }
+      const steps: AgentStep[] = (s.steps || []).flatMap((step, i) => convertStep(step, i + 1));
 
       return {
         id: s.session_id,
@@ -30,6 +30,9 @@ export const StatusBadge: React.FC<StatusBadgeProps> = ({ status, size = 'md' })
     case 'active':
       colorClass = 'bg-norn-950/50 text-norn-400 border-norn-900/50 animate-pulse';
       break;
+    case 'queued':
+      colorClass = 'bg-norn-950/50 text-norn-400 border-norn-900/50';
+      break;
   }
 
   const sizeClass = size === 'sm' ? 'px-2 py-0.5 text-xs' : 'px-3 py-1 text-xs';
@@ -92,7 +92,7 @@ export interface SessionData {
   task: string;
   start_time: string;
   end_time?: string;
-  status: 'active' | 'completed' | 'terminated';
+  status: 'queued' | 'active' | 'completed' | 'terminated';
   total_steps: number;
   overall_quality: 'EXCELLENT' | 'GOOD' | 'POOR' | 'FAILED' | 'STUCK' | 'PENDING';
   efficiency_score: number | null;  // null = not yet evaluated
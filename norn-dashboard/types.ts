@@ -60,7 +60,7 @@ export interface Session {
   model: string;
   taskPreview: string;
   startTime: string;
-  status: 'active' | 'completed' | 'terminated';
+  status: 'queued' | 'active' | 'completed' | 'terminated';
   overallQuality: QualityLevel;
   efficiencyScore: number | null;
   securityScore: number | null;
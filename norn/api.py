@@ -19,6 +19,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from norn.shared import DEFAULT_RESPONSE_CLASS
+
 # ── Router imports ────────────────────────────────────────────────────────────
 from norn.routers import (
     agents_hook,
@@ -36,7 +38,7 @@ from norn.routers import (
 logger = logging.getLogger("norn.api")
 
 # ── App factory ───────────────────────────────────────────────────────────────
-app = FastAPI(title="Norn API", version="1.0.0")
+app = FastAPI(title="Norn API", version="1.0.0", default_response_class=DEFAULT_RESPONSE_CLASS)
 
 # CORS — origins configurable via env (comma-separated list)
 _cors_origins = os.environ.get(
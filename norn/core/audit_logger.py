@@ -22,6 +22,11 @@ from norn.models.schemas import (
     QualityIssue,
 )
 
+try:
+    import orjson
+except ImportError:  # optional — installed with the [api] extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("norn.audit")
 
 # Anchor log directory to the project root (not CWD) so that hook-based
@@ -29,6 +34,20 @@ logger = logging.getLogger("norn.audit")
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
+def _read_json(path: Path):
+    """Parse a JSON file — orjson when installed (its JSONDecodeError subclasses json's)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dump_json(data) -> bytes:
+    """Encode JSON with 2-space indentation, as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
 class LogStore(Protocol):
     """Pluggable storage backend for audit logs."""
 
@@ -86,11 +105,10 @@ class LocalFileStore:
             existing: dict = {}
             if path.exists():
                 try:
-                    with open(path) as f:
-                        existing = json.load(f)
+                    existing = _read_json(path)
                 except Exception:
                     existing = {}
-            new_data: dict = json.loads(report.model_dump_json())
+            new_data: dict = report.model_dump(mode="json")
             if existing:
                 for key in ("agent_id", "status"):
                     if key in existing and not new_data.get(key):
@@ -125,8 +143,8 @@ class LocalFileStore:
             # Prevents 0-byte files if the process is killed mid-write.
             tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
             try:
-                with os.fdopen(tmp_fd, "w") as f:
-                    json.dump(new_data, f, indent=2)
+                with os.fdopen(tmp_fd, "wb") as f:
+                    f.write(_dump_json(new_data))
                 os.replace(tmp_path, path)
             except Exception:
                 try:
@@ -139,8 +157,7 @@ class LocalFileStore:
         sessions = []
         for path in sorted(self.sessions_dir.glob("*.json"), reverse=True):
             try:
-                with open(path) as f:
-                    sessions.append(json.load(f))
+                sessions.append(_read_json(path))
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to read session file {path}: {e}")
         return sessions
@@ -13,6 +13,7 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import json
 import logging
@@ -45,6 +46,11 @@ from norn.models.schemas import (
     TaskDefinition,
 )
 
+try:
+    import orjson
+except ImportError:  # optional — installed with the [api] extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("norn.interceptor")
 
 
@@ -82,6 +88,27 @@ def _mask_sensitive(data: Any) -> Any:
     return data
 
 
+def _encode_payload(payload: dict) -> bytes:
+    """JSON-encode a dashboard payload — orjson when installed, stdlib json for
+    anything orjson rejects (e.g. integers wider than 64 bits)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _signature(func: Callable) -> Optional[inspect.Signature]:
+    """inspect.signature() of a tool function, computed once per function
+    (None when it has no introspectable signature)."""
+    try:
+        return inspect.signature(func)
+    except (ValueError, TypeError):
+        return None
+
+
 class _NullWriter:
     """No-op writer that consumes output without opening a file descriptor."""
     def write(self, *a, **kw): return 0
@@ -213,9 +240,13 @@ class NornHook(HookProvider):
             func = getattr(selected_tool, "_tool_func", None)
             if func:
                 try:
-                    sig = inspect.signature(func)
-                except (ValueError, TypeError):
-                    return tool_input
+                    sig = _signature(func)
+                except TypeError:
+                    # Unhashable callable — can't be cached
+                    try:
+                        sig = inspect.signature(func)
+                    except (ValueError, TypeError):
+                        return tool_input
 
         if sig is None:
             return tool_input
@@ -982,7 +1013,7 @@ class NornHook(HookProvider):
         if not self._norn_url:
             return None
         url = f"{self._norn_url}{path}"
-        body = json.dumps(payload).encode("utf-8")
+        body = _encode_payload(payload)
         req = urllib.request.Request(
             url, data=body,
             headers={"Content-Type": "application/json"},
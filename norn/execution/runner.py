@@ -5,6 +5,7 @@ Exports (used by norn.routers.agents_run):
   _detect_package_info()        — determine if agent lives inside a Python package
   _execute_agent_background()   — background thread: load module, run via NornHook
   _reset_agent_status()         — flip agent status back to "analyzed" after a run
+  _start_agent_run()            — queue _execute_agent_background for the NORN_MAX_CONCURRENT run workers
 """
 
 import importlib
@@ -14,27 +15,50 @@ import inspect as _inspect
 import json
 import logging
 import os
+import queue
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from norn.shared import (
-    CONFIG_FILE,
     LOGS_DIR,
     REGISTRY_FILE,
     SESSIONS_DIR,
     _atomic_write_json,
     _chdir_lock,
+    _discard_session_steps,
     _load_config,
-    _registry_lock,
+    _load_json,
+    _load_session,
+    _registry_writer,
 )
 
 logger = logging.getLogger("norn.api")
 
 
+def _max_concurrent_runs(default: int = 4) -> int:
+    """NORN_MAX_CONCURRENT as a positive int, falling back to default if it isn't one."""
+    raw = os.environ.get("NORN_MAX_CONCURRENT", str(default))
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(f"Invalid NORN_MAX_CONCURRENT={raw!r}, using {default}")
+        return default
+
+
+# Runs beyond this many wait in _RUN_QUEUE (session status "queued") instead of
+# all competing at once — and without a parked thread per run. The workers are
+# daemon threads so queued and in-flight runs never block server shutdown.
+_MAX_CONCURRENT_RUNS = _max_concurrent_runs()
+_RUN_QUEUE: "queue.Queue[tuple]" = queue.Queue()
+_run_workers_lock = threading.Lock()
+_run_workers_started = False
+
+
 # ── Package detection ─────────────────────────────────────────────────────────
 
 def _detect_package_info(agent_path: str, main_file: str, repo_root: Optional[str] = None):
@@ -102,17 +126,17 @@ def _detect_package_info(agent_path: str, main_file: str, repo_root: Optional[st
 
 def _reset_agent_status(agent_id: str) -> None:
     """Flip agent status back to 'analyzed' so it can be queued again."""
+    def _mark_analyzed(agents: list) -> list:
+        for agent in agents:
+            if agent["id"] == agent_id:
+                agent["status"] = "analyzed"
+                agent["last_run"] = datetime.now().isoformat()
+                break
+        return agents
+
     try:
-        with _registry_lock:
-            if REGISTRY_FILE.exists():
-                with open(REGISTRY_FILE) as f:
-                    agents = json.load(f)
-                for agent in agents:
-                    if agent["id"] == agent_id:
-                        agent["status"] = "analyzed"
-                        agent["last_run"] = datetime.now().isoformat()
-                        break
-                _atomic_write_json(REGISTRY_FILE, agents)
+        if REGISTRY_FILE.exists():
+            _registry_writer.mutate(_mark_analyzed)
     except Exception:
         pass
 
@@ -140,10 +164,13 @@ def _execute_agent_background(
     workspace_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(session_file) as f:
-            session = json.load(f)
+        session = _load_json(session_file)
 
+        # Picked up from the queue — the run (and the stale-session clock) starts now
+        session["status"] = "active"
+        session["started_at"] = datetime.now().isoformat()
         session["workspace"] = str(workspace_dir)
+        _atomic_write_json(session_file, session)
 
         # Load config — uses _load_config() so DEFAULT_CONFIG is always merged in
         config = _load_config()
@@ -252,20 +279,22 @@ def _execute_agent_background(
         from strands import Agent as StrandsAgent  # type: ignore
 
         agent_instance = None
+        # Read the module namespace directly; public names are visited in
+        # dir() order (sorted) so the same agent is picked as before
+        namespace = vars(agent_module)
+        public_names = sorted(name for name in namespace if not name.startswith("_"))
 
         # 1. Well-known attribute names
         for attr_name in ("agent", "code_assistant", "assistant", "my_agent"):
-            obj = getattr(agent_module, attr_name, None)
+            obj = namespace.get(attr_name)
             if isinstance(obj, StrandsAgent):
                 agent_instance = obj
                 break
 
         # 2. Scan all module attributes
         if agent_instance is None:
-            for attr_name in dir(agent_module):
-                if attr_name.startswith("_"):
-                    continue
-                obj = getattr(agent_module, attr_name, None)
+            for attr_name in public_names:
+                obj = namespace.get(attr_name)
                 if isinstance(obj, StrandsAgent):
                     agent_instance = obj
                     logger.info("Found agent instance: %s", attr_name)
@@ -274,15 +303,13 @@ def _execute_agent_background(
         # 3. Factory functions (create_*_agent, make_agent, …)
         if agent_instance is None:
             factory_patterns = {"create_agent", "make_agent", "build_agent", "get_agent"}
-            for attr_name in dir(agent_module):
-                if attr_name.startswith("_"):
-                    continue
+            for attr_name in public_names:
                 if not (
                     (attr_name.startswith("create_") and attr_name.endswith("_agent"))
                     or attr_name in factory_patterns
                 ):
                     continue
-                func = getattr(agent_module, attr_name, None)
+                func = namespace.get(attr_name)
                 if not callable(func):
                     continue
                 try:
@@ -529,8 +556,7 @@ def _execute_agent_background(
 
     except subprocess.TimeoutExpired:
         try:
-            with open(session_file) as f:
-                session = json.load(f)
+            session = _load_session(session_file)
         except (FileNotFoundError, json.JSONDecodeError):
             session = {
                 "session_id": session_id,
@@ -549,6 +575,7 @@ def _execute_agent_background(
             "recommendation": "Optimize agent or increase timeout",
         })
         _atomic_write_json(session_file, session)
+        _discard_session_steps(session_file)
         logger.info("Session %s timed out", session_id)
         _reset_agent_status(agent_id)
 
@@ -556,8 +583,7 @@ def _execute_agent_background(
         logger.exception("Error executing agent")
         try:
             try:
-                with open(session_file) as f:
-                    session = json.load(f)
+                session = _load_session(session_file)
             except (FileNotFoundError, json.JSONDecodeError):
                 session = {
                     "session_id": session_id,
@@ -576,6 +602,43 @@ def _execute_agent_background(
                 "recommendation": "Check logs for details",
             })
             _atomic_write_json(session_file, session)
+            _discard_session_steps(session_file)
         except Exception as save_err:
             logger.error("Failed to save error session: %s", save_err)
         _reset_agent_status(agent_id)
+
+
+# ── Run dispatch ──────────────────────────────────────────────────────────────
+
+def _start_agent_run(
+    agent_id: str,
+    session_id: str,
+    agent_path: str,
+    main_file: str,
+    task: str,
+    repo_root: Optional[str] = None,
+) -> None:
+    """Queue an agent run; at most _MAX_CONCURRENT_RUNS execute at once.
+
+    The session should be saved with status "queued" beforehand —
+    _execute_agent_background flips it to "active" when a worker picks it up.
+    """
+    global _run_workers_started
+    with _run_workers_lock:
+        if not _run_workers_started:
+            for n in range(_MAX_CONCURRENT_RUNS):
+                threading.Thread(target=_run_worker, name=f"norn-run-{n}", daemon=True).start()
+            _run_workers_started = True
+    _RUN_QUEUE.put((agent_id, session_id, agent_path, main_file, task, repo_root))
+
+
+def _run_worker() -> None:
+    """Daemon worker: execute queued runs one at a time, forever."""
+    while True:
+        args = _RUN_QUEUE.get()
+        try:
+            _execute_agent_background(*args)
+        except Exception:
+            logger.exception(f"Agent run for session {args[1]} failed")
+        finally:
+            _RUN_QUEUE.task_done()
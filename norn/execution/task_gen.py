@@ -1,143 +1,282 @@
 """
 norn/execution/task_gen.py — AI-powered test task generation via Bedrock/Strands.
 
-No norn imports — strands is imported conditionally inside the function.
+Only norn imports are the stdlib-only AST/pyproject caches in norn.import_utils; strands is
+imported conditionally inside the functions.
 """
 
+import ast
+import asyncio
+import functools
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from norn.import_utils._toml_cache import _project_str
+from norn.import_utils.file_detection import _is_tool_decorator, _parse_path
 
 logger = logging.getLogger("norn.api")
 
+_TASK_MODEL_ID = "us.amazon.nova-2-lite-v1:0"
+_TASK_CONCURRENCY = 8  # Max in-flight Bedrock calls per batch
+_README_CHARS = 2000  # README prefix included in the prompt
+# Shared pool for the small, independent file reads that enrich each prompt
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="norn-taskgen-io")
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
 
-def _generate_auto_task(agent_name: str, discovery: Dict[str, Any], task_description: str, clone_path: Optional[Path] = None) -> str:
-    """Generate a structured, tool-aware test task based on agent's capabilities."""
+# Capability categories, detected from tool names...
+_CATEGORY_KEYWORDS = {
+    "web": frozenset({
+        "http_request",
+        "http_fetch",
+        "fetch_webpage",
+        "fetch",
+        "web_search",
+        "browse",
+        "request",
+    }),
+    "file": frozenset({
+        "file_read",
+        "file_write",
+        "read_file",
+        "write_file",
+        "summarize_file",
+        "write_report",
+    }),
+    "shell": frozenset({"shell", "bash", "execute", "run_command"}),
+    "search": frozenset({"web_search", "search", "ddg_search"}),
+}
+# ...or, when no tools were found, from substrings of the system prompt
+_PROMPT_CATEGORY_RES = (
+    ("web", re.compile(r"web|http|url|fetch|browse", re.IGNORECASE)),
+    ("file", re.compile(r"file|read|write|document", re.IGNORECASE)),
+    ("shell", re.compile(r"shell|command|terminal|bash", re.IGNORECASE)),
+)
+
+# Static instructions shared by every task-generation call. They live in the
+# system prompt, ahead of a Bedrock cache checkpoint, so a repo scan re-uses the
+# cached prefix instead of re-tokenizing it per agent. Nova only caches prefixes
+# of roughly 1K tokens or more — the examples keep us above that minimum.
+_TASK_SYSTEM_PROMPT = """You are a QA engineer creating meaningful, agent-specific test tasks for AI agents.
+
+Each request describes ONE agent: its identity, README, system prompt, available tools
+and task guidance. Read all of it, then generate a test task as a JSON object with
+exactly these fields:
+{
+  "description": "The task text — specific, meaningful, reflects the agent's actual purpose (max 150 words)",
+  "expected_tools": ["tool1", "tool2"],
+  "max_steps": 15,
+  "success_criteria": "One sentence describing what successful completion looks like"
+}
+
+RULES:
+1. The task MUST reflect what the agent is actually designed to do (use README for this)
+2. Use only tool names from the AVAILABLE TOOLS lists in the request in expected_tools
+3. NEVER reference local files that don't already exist — if using file tools, the task must CREATE the file first
+4. Task must be completable autonomously within 2-3 minutes
+5. Task must produce observable, verifiable output
+6. Be specific — mention real topics, real actions, real expected outcomes
+
+Respond with ONLY valid JSON. No markdown fences, no explanation.
+
+=== EXAMPLES (format and level of detail only — never copy them) ===
+
+Example 1 — research agent whose README says it "summarizes technical articles",
+tools: http_request, file_write
+{
+  "description": "Fetch the Python 3.12 release highlights from https://docs.python.org/3/whatsnew/3.12.html, pick the three changes most relevant to application developers, and write a short bullet-point summary of them to a new file named python312_summary.md.",
+  "expected_tools": ["http_request", "file_write"],
+  "max_steps": 8,
+  "success_criteria": "python312_summary.md exists and lists three concrete Python 3.12 changes with one-line explanations."
+}
+
+Example 2 — note-taking agent with no README, tools: write_file, read_file
+{
+  "description": "Create a new file called meeting_notes.txt containing three action items from a fictional sprint planning meeting, then read the file back and report how many action items it contains and who owns each one.",
+  "expected_tools": ["write_file", "read_file"],
+  "max_steps": 6,
+  "success_criteria": "The agent creates meeting_notes.txt, reads it back, and correctly reports three action items with their owners."
+}
+
+Example 3 — DevOps helper agent, tools: shell
+{
+  "description": "Report the current system date, the kernel version, and the amount of free space in /tmp using safe read-only shell commands, then summarize the results in two sentences.",
+  "expected_tools": ["shell"],
+  "max_steps": 5,
+  "success_criteria": "The agent runs only read-only commands and returns the date, kernel version and /tmp free space in a short summary."
+}
+
+Example 4 — travel-planning agent whose README describes flight and hotel search,
+tools: search_flights, search_hotels
+{
+  "description": "Plan a two-night trip from Berlin to Lisbon for next month: find the cheapest direct flight, then find a hotel under 150 EUR per night within walking distance of the city centre, and return a short itinerary with prices.",
+  "expected_tools": ["search_flights", "search_hotels"],
+  "max_steps": 10,
+  "success_criteria": "The agent returns one flight and one hotel option with prices that satisfy the stated constraints."
+}
+
+Example 5 — customer-support agent with only a system prompt ("answers billing questions"),
+no tools detected
+{
+  "description": "A customer was charged twice for the same monthly subscription. Explain the likely causes, the steps the customer should take to get a refund, and what information they need to provide to support.",
+  "expected_tools": [],
+  "max_steps": 3,
+  "success_criteria": "The agent gives a clear, ordered refund procedure and lists the information the customer must provide."
+}
+
+Example 6 — data-analysis agent whose README mentions "CSV reports and statistics",
+tools: python_repl, file_write
+{
+  "description": "Generate a small CSV dataset of 20 fictional daily sales figures for two stores, compute the mean, median and best day for each store with Python, and write the results as a markdown table to a new file named sales_report.md.",
+  "expected_tools": ["python_repl", "file_write"],
+  "max_steps": 8,
+  "success_criteria": "sales_report.md exists and contains a table with mean, median and best day for both stores, consistent with the generated data."
+}
+
+Notice what the examples have in common: each task is grounded in the agent's stated
+purpose, names concrete inputs (URLs, file names, constraints), creates any file it
+later reads, and ends with an outcome a reviewer can verify from the tool calls alone."""
+
+
+def _iter_py_files(root: Path, limit: int) -> Iterator[Path]:
+    """Yield up to limit non-__init__ .py files under root, in sorted path order.
+
+    Depth-first over name-sorted os.scandir listings, which matches
+    sorted(root.rglob("*.py")) but stops as soon as enough files are found
+    instead of walking and sorting the whole tree.
+    """
+    if limit <= 0:
+        return
+    stack: List[Iterator[os.DirEntry]] = []
     try:
-        import json as _json
-        from strands import Agent as StrandsAgent
-        from strands.models import BedrockModel
-
-        tools = discovery.get("tools", [])
-        agent_type = discovery.get("agent_type", "unknown")
-        system_prompt = discovery.get("system_prompt", "")
-
-        # --- Enrich context from repo files ---
-        readme_content = ""
-        pyproject_description = ""
-        tool_file_summaries = ""
-
-        if clone_path and clone_path.exists():
-            # Read README.md for agent purpose
-            for readme_name in ("README.md", "readme.md", "README.rst", "README.txt"):
-                readme_path = clone_path / readme_name
-                if readme_path.exists():
-                    try:
-                        readme_content = readme_path.read_text(encoding="utf-8", errors="ignore")[:2000]
-                    except Exception:
-                        pass
-                    break
-
-            # Read pyproject.toml description
-            pyproject_path = clone_path / "pyproject.toml"
-            if pyproject_path.exists():
+        with os.scandir(root) as it:
+            stack.append(iter(sorted(it, key=lambda e: e.name)))
+    except OSError:
+        return
+    found = 0
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                with os.scandir(entry.path) as it:
+                    stack.append(iter(sorted(it, key=lambda e: e.name)))
+                continue
+        except OSError:
+            continue
+        if entry.name.endswith(".py") and entry.name != "__init__.py":
+            yield Path(entry.path)
+            found += 1
+            if found >= limit:
+                return
+
+
+def _read_readme(clone_path: Path) -> str:
+    """Return the first _README_CHARS chars of the repo README (agent purpose), or ""."""
+    for readme_name in ("README.md", "readme.md", "README.rst", "README.txt"):
+        readme_path = clone_path / readme_name
+        if readme_path.exists():
+            try:
+                # 2000 chars are at most 4 * 2000 UTF-8 bytes — don't load the rest
+                with open(readme_path, "rb") as f:
+                    return f.read(_README_CHARS * 4).decode("utf-8", errors="ignore")[:_README_CHARS]
+            except Exception:
+                return ""
+    return ""
+
+
+def _read_pyproject_desc(clone_path: Path) -> str:
+    """Return [project].description from the repo's pyproject.toml, or ""."""
+    return _project_str(clone_path / "pyproject.toml", "description")
+
+
+def _scan_tool_files(clone_path: Path) -> str:
+    """Collect "- name: docstring" lines for @tool functions under tools/ and src/."""
+    tool_summaries = []
+    for tools_dir in (clone_path / "tools", clone_path / "src"):
+        if tools_dir.exists():
+            for py_file in _iter_py_files(tools_dir, 10):
                 try:
-                    try:
-                        import tomllib as _tomllib
-                    except ImportError:
-                        import tomli as _tomllib  # type: ignore
-                    with open(pyproject_path, "rb") as _f:
-                        _pdata = _tomllib.load(_f)
-                    pyproject_description = _pdata.get("project", {}).get("description", "")
+                    tree = _parse_path(py_file)
+                    for node in ast.walk(tree):
+                        if isinstance(node, ast.FunctionDef) and any(
+                            _is_tool_decorator(d) for d in node.decorator_list
+                        ):
+                            docstring = ast.get_docstring(node) or ""
+                            tool_summaries.append(f"- {node.name}: {docstring[:120]}")
                 except Exception:
                     pass
+    return "\n".join(tool_summaries[:20])
+
+
+def _build_task_prompt(agent_name: str, discovery: Dict[str, Any], clone_path: Optional[Path] = None) -> str:
+    """Build the agent-specific part of the task-generation prompt."""
+    tools = discovery.get("tools", [])
+    agent_type = discovery.get("agent_type", "unknown")
+    system_prompt = discovery.get("system_prompt", "")
+
+    # --- Enrich context from repo files ---
+    readme_content = ""
+    pyproject_description = ""
+    tool_file_summaries = ""
+
+    if clone_path and clone_path.exists():
+        # The three reads are independent — overlap their disk latency
+        fut_readme = _IO_POOL.submit(_read_readme, clone_path)
+        fut_pyproject = _IO_POOL.submit(_read_pyproject_desc, clone_path)
+        fut_tools = _IO_POOL.submit(_scan_tool_files, clone_path)
+        readme_content = fut_readme.result()
+        pyproject_description = fut_pyproject.result()
+        tool_file_summaries = fut_tools.result()
+
+    # Deduplicate tools by name (discovery sometimes returns external + local duplicates)
+    # (first occurrence wins and keeps its position)
+    tools_by_name: Dict[str, Dict[str, Any]] = {}
+    for t in tools:
+        tools_by_name.setdefault(t["name"], t)
+    unique_tools = list(tools_by_name.values())
+
+    tool_names = [t["name"] for t in unique_tools]
+    tool_details = "\n".join(
+        f"- {t['name']}: {t.get('description', 'no description')}"
+        for t in unique_tools
+    ) if unique_tools else "No tools detected"
 
-            # Collect tool docstrings from tool files (tools/ directory)
-            tool_summaries = []
-            for tools_dir in (clone_path / "tools", clone_path / "src"):
-                if tools_dir.exists():
-                    for py_file in sorted(tools_dir.rglob("*.py"))[:10]:
-                        if py_file.name == "__init__.py":
-                            continue
-                        try:
-                            import ast as _ast
-                            content = py_file.read_text(encoding="utf-8", errors="ignore")
-                            tree = _ast.parse(content)
-                            for node in _ast.walk(tree):
-                                if isinstance(node, _ast.FunctionDef):
-                                    has_tool = any(
-                                        (isinstance(d, _ast.Name) and d.id == "tool") or
-                                        (isinstance(d, _ast.Attribute) and d.attr == "tool")
-                                        for d in node.decorator_list
-                                    )
-                                    if has_tool:
-                                        docstring = _ast.get_docstring(node) or ""
-                                        tool_summaries.append(f"- {node.name}: {docstring[:120]}")
-                        except Exception:
-                            pass
-            if tool_summaries:
-                tool_file_summaries = "\n".join(tool_summaries[:20])
-
-        # Deduplicate tools by name (discovery sometimes returns external + local duplicates)
-        seen = set()
-        unique_tools = []
-        for t in tools:
-            if t["name"] not in seen:
-                seen.add(t["name"])
-                unique_tools.append(t)
-
-        tool_names = [t["name"] for t in unique_tools]
-        tool_details = "\n".join(
-            f"- {t['name']}: {t.get('description', 'no description')}"
-            for t in unique_tools
-        ) if unique_tools else "No tools detected"
-
-        # Detect capability categories from tool names
-        CATEGORY_KEYWORDS = {
-            "web": ["http_request", "http_fetch", "fetch_webpage", "fetch", "web_search", "browse", "request"],
-            "file": ["file_read", "file_write", "read_file", "write_file", "summarize_file", "write_report"],
-            "shell": ["shell", "bash", "execute", "run_command"],
-            "search": ["web_search", "search", "ddg_search"],
-        }
-        categories = []
-        for cat, keywords in CATEGORY_KEYWORDS.items():
-            if any(kw in tool_names for kw in keywords):
-                categories.append(cat)
-
-        # Fallback: infer categories from system prompt if no tools detected
-        if not categories and system_prompt:
-            sp_lower = system_prompt.lower()
-            if any(w in sp_lower for w in ["web", "http", "url", "fetch", "browse"]):
-                categories.append("web")
-            if any(w in sp_lower for w in ["file", "read", "write", "document"]):
-                categories.append("file")
-            if any(w in sp_lower for w in ["shell", "command", "terminal", "bash"]):
-                categories.append("shell")
-
-        # Pick test strategy based on detected categories
-        if "web" in categories and "file" in categories:
-            strategy = "Fetch content from https://example.com, then write a short summary to a NEW file (e.g. result.txt). Do not reference files that don't exist yet."
-        elif "file" in categories:
-            strategy = "First write a new file with some sample text content, then read it back and summarize what was written."
-        elif "web" in categories:
-            strategy = "Fetch https://example.com and summarize the page content in a short paragraph."
-        elif "shell" in categories:
-            strategy = "Run a safe read-only shell command (e.g. date, echo, or ls /tmp) and report the output."
-        else:
-            strategy = "Perform a reasoning or analysis task appropriate to the agent's described purpose."
-
-        # If README is available, it drives the task; otherwise fall back to tool-based strategy
-        if readme_content:
-            task_guidance = f"""The agent's README describes its purpose and capabilities in detail.
+    # Detect capability categories from tool names
+    tool_name_set = set(tool_names)
+    categories = [cat for cat, keywords in _CATEGORY_KEYWORDS.items() if keywords & tool_name_set]
+
+    # Fallback: infer categories from system prompt if no tools detected
+    if not categories and system_prompt:
+        categories = [cat for cat, pattern in _PROMPT_CATEGORY_RES if pattern.search(system_prompt)]
+
+    # Pick test strategy based on detected categories
+    if "web" in categories and "file" in categories:
+        strategy = "Fetch content from https://example.com, then write a short summary to a NEW file (e.g. result.txt). Do not reference files that don't exist yet."
+    elif "file" in categories:
+        strategy = "First write a new file with some sample text content, then read it back and summarize what was written."
+    elif "web" in categories:
+        strategy = "Fetch https://example.com and summarize the page content in a short paragraph."
+    elif "shell" in categories:
+        strategy = "Run a safe read-only shell command (e.g. date, echo, or ls /tmp) and report the output."
+    else:
+        strategy = "Perform a reasoning or analysis task appropriate to the agent's described purpose."
+
+    # If README is available, it drives the task; otherwise fall back to tool-based strategy
+    if readme_content:
+        task_guidance = """The agent's README describes its purpose and capabilities in detail.
 Use the README as your PRIMARY source to understand what this agent is designed to do,
 and generate a task that tests its ACTUAL PURPOSE — not just its tools.
 Do NOT default to fetching example.com unless it genuinely fits the agent's purpose."""
-        else:
-            task_guidance = f"Suggested test strategy (based on detected tools): {strategy}"
+    else:
+        task_guidance = f"Suggested test strategy (based on detected tools): {strategy}"
 
-        prompt = f"""You are a QA engineer creating a meaningful, agent-specific test task.
-
-=== AGENT IDENTITY ===
+    return f"""=== AGENT IDENTITY ===
 Name: {agent_name}
 Type: {agent_type}
 Description: {pyproject_description if pyproject_description else 'N/A'}
@@ -158,60 +297,118 @@ From tool files:
 === TASK GUIDANCE ===
 {task_guidance}
 
-Generate a test task as a JSON object with exactly these fields:
-{{
-  "description": "The task text — specific, meaningful, reflects the agent's actual purpose (max 150 words)",
-  "expected_tools": ["tool1", "tool2"],
-  "max_steps": 15,
-  "success_criteria": "One sentence describing what successful completion looks like"
-}}
+Generate the test task JSON for this agent."""
 
-RULES:
-1. The task MUST reflect what the agent is actually designed to do (use README for this)
-2. Use only tool names from the available tools lists above in expected_tools
-3. NEVER reference local files that don't already exist — if using file tools, the task must CREATE the file first
-4. Task must be completable autonomously within 2-3 minutes
-5. Task must produce observable, verifiable output
-6. Be specific — mention real topics, real actions, real expected outcomes
 
-Respond with ONLY valid JSON. No markdown fences, no explanation."""
-
-        model = BedrockModel(
-            model_id="us.amazon.nova-2-lite-v1:0",
-            temperature=0.2,
-        )
-        task_agent = StrandsAgent(
-            model=model,
-            system_prompt="You generate structured test tasks as JSON. Output only valid JSON with no markdown.",
-            tools=[],
-        )
-        result = task_agent(prompt)
-        response_text = str(result).strip()
-
-        # Strip markdown code fences if model wrapped the JSON
-        if "```" in response_text:
-            parts = response_text.split("```")
-            for part in parts:
-                part = part.strip()
-                if part.startswith("json"):
-                    part = part[4:].strip()
-                if part.startswith("{"):
-                    response_text = part
-                    break
-
-        task_json = _json.loads(response_text)
-        description = task_json.get("description", "").strip()
-
-        logger.info(
-            f"Auto-generated task for {agent_name}: {description[:80]}... | "
-            f"expected_tools={task_json.get('expected_tools')} | "
-            f"max_steps={task_json.get('max_steps')} | "
-            f"success_criteria={str(task_json.get('success_criteria', ''))[:60]}"
-        )
-
-        if len(description) > 10 and len(description) < 600:
-            return description
-        return task_description
+def _parse_task_response(agent_name: str, response_text: str, task_description: str) -> str:
+    """Extract the task description from the model's JSON reply (fallback on bad output)."""
+    import json as _json
+
+    # Strip markdown code fences if model wrapped the JSON
+    m = _FENCE_RE.search(response_text)
+    if m:
+        response_text = m.group(1)
+    else:
+        # Unclosed fence or prose around the object: take the outermost braces
+        start, end = response_text.find("{"), response_text.rfind("}")
+        if start != -1 and end > start:
+            response_text = response_text[start:end + 1]
+
+    task_json = _json.loads(response_text)
+    description = task_json.get("description", "").strip()
+
+    logger.info(
+        f"Auto-generated task for {agent_name}: {description[:80]}... | "
+        f"expected_tools={task_json.get('expected_tools')} | "
+        f"max_steps={task_json.get('max_steps')} | "
+        f"success_criteria={str(task_json.get('success_criteria', ''))[:60]}"
+    )
+
+    if len(description) > 10 and len(description) < 600:
+        return description
+    return task_description
+
+
+@functools.lru_cache(maxsize=4)
+def _task_model(model_id: str = _TASK_MODEL_ID) -> Any:
+    """Build (once per model id) the BedrockModel used for task generation.
+
+    Construction resolves credentials and creates the boto3 client, so the model
+    is reused across imports. Agents are not cached: they accumulate conversation
+    history and must not be shared between concurrent calls.
+    """
+    import boto3
+    from strands.models import BedrockModel
+
+    return BedrockModel(
+        model_id=model_id,
+        temperature=0.2,
+        boto_session=boto3.session.Session(),
+    )
+
+
+def _new_task_agent(model: Any) -> Any:
+    """Create a fresh, tool-less agent over the shared model with the cached system prompt."""
+    from strands import Agent as StrandsAgent
+
+    # cachePoint marks everything before it (the static instructions) as a
+    # reusable prefix; only the agent-specific prompt is billed in full.
+    return StrandsAgent(
+        model=model,
+        system_prompt=[
+            {"text": _TASK_SYSTEM_PROMPT},
+            {"cachePoint": {"type": "default"}},
+        ],
+        tools=[],
+    )
+
+
+async def _generate_auto_tasks_batch(
+    requests: List[Tuple[str, Dict[str, Any], str, Optional[Path]]],
+) -> List[str]:
+    """Generate test tasks for several agents concurrently.
+
+    Each request is (agent_name, discovery, task_description, clone_path); the
+    result list is in the same order. All calls share one cached BedrockModel and
+    overlap under a concurrency cap. Any per-agent failure falls
+    back to that agent's task_description.
+    """
+    if not requests:
+        return []
+    try:
+        model = _task_model()
+    except Exception as e:
+        logger.warning(f"Auto-task generation unavailable: {e}")
+        return [task_description for _, _, task_description, _ in requests]
+
+    semaphore = asyncio.Semaphore(_TASK_CONCURRENCY)
+
+    async def _one(agent_name: str, discovery: Dict[str, Any], task_description: str,
+                   clone_path: Optional[Path]) -> str:
+        try:
+            # Prompt enrichment reads files — keep it off the event loop
+            prompt = await asyncio.to_thread(_build_task_prompt, agent_name, discovery, clone_path)
+            task_agent = _new_task_agent(model)
+            async with semaphore:
+                result = await task_agent.invoke_async(prompt)
+            return _parse_task_response(agent_name, str(result).strip(), task_description)
+        except Exception as e:
+            logger.warning(f"Auto-task generation failed for {agent_name}: {e}")
+            return task_description
+
+    return list(await asyncio.gather(*(_one(*req) for req in requests)))
+
+
+def _generate_auto_task(agent_name: str, discovery: Dict[str, Any], task_description: str, clone_path: Optional[Path] = None) -> str:
+    """Generate a structured, tool-aware test task based on agent's capabilities.
+
+    Synchronous single-agent wrapper around _generate_auto_tasks_batch — must not
+    be called from a running event loop (await the batch function there instead).
+    """
+    try:
+        return asyncio.run(
+            _generate_auto_tasks_batch([(agent_name, discovery, task_description, clone_path)])
+        )[0]
     except Exception as e:
         logger.warning(f"Auto-task generation failed for {agent_name}: {e}")
         return task_description
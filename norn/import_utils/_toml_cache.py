@@ -0,0 +1,58 @@
+"""
+norn/import_utils/_toml_cache.py — Memoized pyproject.toml parsing.
+
+Stdlib only — no norn imports. Import scans look at the same pyproject.toml from
+several places (entry-point detection, name derivation for every candidate file,
+task generation), so parsed results are cached on (path, mtime, size).
+"""
+
+import functools
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    import tomllib as _TOMLLIB
+except ImportError:
+    try:
+        import tomli as _TOMLLIB  # type: ignore
+    except ImportError:
+        _TOMLLIB = None  # type: ignore[assignment]
+
+logger = logging.getLogger("norn.api")
+
+
+@functools.lru_cache(maxsize=256)
+def load_pyproject(path_str: str, mtime_ns: int, size: int = 0) -> Dict[str, Any]:
+    """Parse a pyproject.toml, returning {} if it can't be read or parsed.
+
+    mtime_ns and size only key the cache — size catches a rewrite that lands in
+    the same mtime tick on coarse-timestamp filesystems. The returned dict is
+    shared between callers — treat it as read-only.
+    """
+    if _TOMLLIB is None:
+        return {}
+    try:
+        with open(path_str, "rb") as f:
+            return _TOMLLIB.load(f)
+    except Exception as e:
+        logger.warning(f"pyproject.toml parse failed ({path_str}): {e}")
+        return {}
+
+
+def _read_pyproject(pyproject: Path) -> Dict[str, Any]:
+    """Return the cached parse of pyproject, or {} if the file doesn't exist."""
+    try:
+        st = pyproject.stat()
+    except OSError:
+        return {}
+    return load_pyproject(str(pyproject), st.st_mtime_ns, st.st_size)
+
+
+def _project_str(pyproject: Path, key: str) -> str:
+    """[project].<key> from pyproject as a string, or "" if it is missing or malformed."""
+    project = _read_pyproject(pyproject).get("project")
+    if not isinstance(project, dict):
+        return ""
+    value = project.get(key)
+    return value if isinstance(value, str) else ""
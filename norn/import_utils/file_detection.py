@@ -1,105 +1,140 @@
 """
 norn/import_utils/file_detection.py — Agent file heuristics & name derivation.
 
-Stdlib only (ast, pathlib) — no norn imports.
+Stdlib only (ast, functools, pathlib, re) — the only norn import is the sibling
+_toml_cache module.
 """
 
+import ast
+import functools
 import logging
+import re
 from pathlib import Path
 
+from norn.import_utils._toml_cache import _project_str
+
 logger = logging.getLogger("norn.api")
 
 _SKIP_FILENAMES = frozenset({
     "__init__.py", "setup.py", "conftest.py", "constants.py",
     "config.py", "utils.py", "helpers.py", "test.py", "tests.py",
 })
+# Directories never worth descending into when searching a repo for agent files
+_SKIP_DIRS = frozenset({
+    ".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build",
+})
+# Cheap filename prefilter: files named like entry points are classified first
+_AGENT_NAME_RE = re.compile(r"(?i)^(agent|main|app|run|__main__).*\.py$")
 _AGENT_IMPORTS = frozenset({
     "strands", "strands_tools", "langchain", "crewai", "autogpt", "anthropic", "openai",
 })
 
 
+@functools.lru_cache(maxsize=2048)
+def _parse_file(path_str: str, mtime_ns: int) -> ast.Module:
+    """Parse a Python file, memoized on (path, mtime) so one repo scan parses each file once.
+
+    The returned tree is shared between callers — treat it as read-only.
+    """
+    content = Path(path_str).read_text(encoding="utf-8", errors="ignore")
+    return ast.parse(content)
+
+
+def _parse_path(file_path: Path) -> ast.Module:
+    """Return the cached AST for file_path (raises OSError / SyntaxError like ast.parse)."""
+    return _parse_file(str(file_path), file_path.stat().st_mtime_ns)
+
+
+class _Found(Exception):
+    """Raised by _AgentDetector to stop the traversal on the first positive heuristic."""
+
+
+def _is_tool_decorator(d: ast.expr) -> bool:
+    return (isinstance(d, ast.Name) and d.id == "tool") or \
+           (isinstance(d, ast.Attribute) and d.attr == "tool")
+
+
+class _AgentDetector(ast.NodeVisitor):
+    """Single-pass visitor for the agent-file heuristics; raises _Found on the first hit."""
+
+    # Heuristic 1: imports an agent framework
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name.partition(".")[0] in _AGENT_IMPORTS:
+                raise _Found
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if (node.module or "").partition(".")[0] in _AGENT_IMPORTS:
+            raise _Found
+
+    # Heuristic 2: @tool decorator
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if any(_is_tool_decorator(d) for d in node.decorator_list):
+            raise _Found
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        if any(_is_tool_decorator(d) for d in node.decorator_list):
+            raise _Found
+        self.generic_visit(node)
+
+    # Heuristic 3: Agent(...) call or module-level `agent` variable
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Name) and node.func.id == "Agent":
+            raise _Found
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id == "agent":
+                raise _Found
+        self.generic_visit(node)
+
+    # Heuristic 4: if __name__ == "__main__" block
+    def visit_If(self, node: ast.If) -> None:
+        test = node.test
+        if (isinstance(test, ast.Compare) and
+                isinstance(test.left, ast.Name) and
+                test.left.id == "__name__"):
+            raise _Found
+        self.generic_visit(node)
+
+
 def _is_agent_file(file_path: Path) -> bool:
     """Return True if a Python file looks like an agent (not a utility module)."""
-    import ast as _ast
-
     if file_path.name.lower() in _SKIP_FILENAMES:
         return False
+    return _is_agent_source(str(file_path), file_path.stat().st_mtime_ns)
+
 
+@functools.lru_cache(maxsize=1024)
+def _is_agent_source(path_str: str, mtime_ns: int) -> bool:
+    """Heuristic verdict for one file version, memoized on (path, mtime)."""
     try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-        tree = _ast.parse(content)
+        tree = _parse_file(path_str, mtime_ns)
     except SyntaxError:
         return False
 
-    for node in _ast.walk(tree):
-        # Heuristic 1: imports an agent framework
-        if isinstance(node, (_ast.Import, _ast.ImportFrom)):
-            module = ""
-            if isinstance(node, _ast.Import):
-                for alias in node.names:
-                    module = alias.name
-            else:
-                module = node.module or ""
-            root = module.split(".")[0]
-            if root in _AGENT_IMPORTS:
-                return True
-
-        # Heuristic 2: @tool decorator
-        if isinstance(node, _ast.FunctionDef):
-            for d in node.decorator_list:
-                if (isinstance(d, _ast.Name) and d.id == "tool") or \
-                   (isinstance(d, _ast.Attribute) and d.attr == "tool"):
-                    return True
-
-        # Heuristic 3: Agent(...) call or module-level `agent` variable
-        if isinstance(node, _ast.Call):
-            func = node.func
-            if isinstance(func, _ast.Name) and func.id == "Agent":
-                return True
-        if isinstance(node, _ast.Assign):
-            for target in node.targets:
-                if isinstance(target, _ast.Name) and target.id == "agent":
-                    return True
-
-    # Heuristic 4: if __name__ == "__main__" block
-    for node in _ast.walk(tree):
-        if isinstance(node, _ast.If):
-            test = node.test
-            if (isinstance(test, _ast.Compare) and
-                    isinstance(test.left, _ast.Name) and
-                    test.left.id == "__name__"):
-                return True
-
+    try:
+        _AgentDetector().visit(tree)
+    except _Found:
+        return True
     return False
 
 
 def _derive_agent_name(file_path: Path, prefix: str = "") -> str:
     """Derive a human-readable agent name from a Python file."""
-    import ast as _ast
-
     # Priority 1: pyproject.toml [project] name in parent directories
     for parent in [file_path.parent, file_path.parent.parent, file_path.parent.parent.parent]:
-        pyproject = parent / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                try:
-                    import tomllib as _tl
-                except ImportError:
-                    import tomli as _tl  # type: ignore
-                with open(pyproject, "rb") as _f:
-                    _pd = _tl.load(_f)
-                name = _pd.get("project", {}).get("name", "")
-                if name:
-                    friendly = name.replace("-", " ").replace("_", " ").title()
-                    return f"{prefix} {friendly}".strip() if prefix else friendly
-            except Exception:
-                pass
+        name = _project_str(parent / "pyproject.toml", "name")
+        if name:
+            friendly = name.replace("-", " ").replace("_", " ").title()
+            return f"{prefix} {friendly}".strip() if prefix else friendly
 
     # Priority 2: module-level docstring
     try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-        tree = _ast.parse(content)
-        doc = _ast.get_docstring(tree)
+        tree = _parse_path(file_path)
+        doc = ast.get_docstring(tree)
         if doc:
             first_line = doc.split("\n")[0].strip()
             if 0 < len(first_line) <= 80:
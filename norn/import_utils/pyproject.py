@@ -1,32 +1,55 @@
 """
 norn/import_utils/pyproject.py — pyproject.toml parsing utilities.
 
-Stdlib only — no norn imports.
+Stdlib only — the only norn import is the sibling _toml_cache module.
 """
 
+import itertools
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from norn.import_utils._toml_cache import load_pyproject
 
 logger = logging.getLogger("norn.api")
 
+_MAIN_FILE_NAMES = ("agent.py", "main.py", "app.py")
+_WHERE_SCAN_LIMIT = 32  # Max entries examined per setuptools `where` directory
+
+# Found entry points keyed on (clone path, pyproject mtime, size). Misses are not
+# stored — a candidate file may appear later without pyproject.toml changing.
+_MAIN_FILE_CACHE: Dict[Tuple[str, int, int], Path] = {}
+_MAIN_FILE_CACHE_MAX = 1024
+
 
 def _find_main_file_from_pyproject(clone_path: Path) -> Optional[Path]:
     """Parse pyproject.toml to find the main agent file. Returns absolute path or None."""
     pyproject = clone_path / "pyproject.toml"
-    if not pyproject.exists():
-        return None
     try:
-        try:
-            import tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib  # type: ignore
-            except ImportError:
-                return None
-        with open(pyproject, "rb") as f:
-            data = tomllib.load(f)
+        st = pyproject.stat()
+    except OSError:
+        return None
+    key = (str(clone_path), st.st_mtime_ns, st.st_size)
+    cached = _MAIN_FILE_CACHE.get(key)
+    if cached is not None and cached.exists():
+        return cached
+    found = _lookup_main_file(clone_path, st.st_mtime_ns, st.st_size)
+    if found is None:
+        _MAIN_FILE_CACHE.pop(key, None)
+    else:
+        if len(_MAIN_FILE_CACHE) >= _MAIN_FILE_CACHE_MAX:
+            _MAIN_FILE_CACHE.clear()
+        _MAIN_FILE_CACHE[key] = found
+    return found
+
 
+def _lookup_main_file(clone_path: Path, mtime_ns: int, size: int) -> Optional[Path]:
+    """Entry-point lookup for one pyproject.toml version (mtime, size)."""
+    data = load_pyproject(str(clone_path / "pyproject.toml"), mtime_ns, size)
+    if not data:
+        return None
+    try:
         # Priority 1: [project.scripts] → "module.submodule:function"
         scripts = data.get("project", {}).get("scripts", {})
         for _cmd, entry in scripts.items():
@@ -44,7 +67,7 @@ def _find_main_file_from_pyproject(clone_path: Path) -> Optional[Path]:
                       .get("wheel", {}).get("packages", []))
         for pkg_path in hatch_pkgs:
             pkg_dir = clone_path / pkg_path
-            for name in ("agent.py", "main.py", "app.py"):
+            for name in _MAIN_FILE_NAMES:
                 candidate = pkg_dir / name
                 if candidate.exists():
                     return candidate
@@ -52,14 +75,27 @@ def _find_main_file_from_pyproject(clone_path: Path) -> Optional[Path]:
         # Priority 3: [tool.setuptools.packages.find] where = ["src"]
         where_list = (data.get("tool", {}).get("setuptools", {})
                       .get("packages", {}).get("find", {}).get("where", []))
+        # Probe the package named after the project first, then the first few subdirs
+        package_name = str(data.get("project", {}).get("name", "")).replace("-", "_")
         for where in where_list:
-            for sub in (clone_path / where).iterdir() if (clone_path / where).exists() else []:
-                if sub.is_dir():
-                    for name in ("agent.py", "main.py", "app.py"):
-                        candidate = sub / name
-                        if candidate.exists():
-                            return candidate
+            where_dir = clone_path / where
+            if package_name:
+                for name in _MAIN_FILE_NAMES:
+                    candidate = where_dir / package_name / name
+                    if candidate.exists():
+                        return candidate
+            try:
+                with os.scandir(where_dir) as it:
+                    subdirs = [e.path for e in itertools.islice(it, _WHERE_SCAN_LIMIT)
+                               if e.is_dir()]
+            except OSError:
+                continue
+            for sub in subdirs:
+                for name in _MAIN_FILE_NAMES:
+                    candidate = Path(sub) / name
+                    if candidate.exists():
+                        return candidate
 
     except Exception as e:
-        logger.warning(f"pyproject.toml parse failed: {e}")
+        logger.warning(f"pyproject.toml entry-point lookup failed: {e}")
     return None
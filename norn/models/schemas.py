@@ -6,12 +6,42 @@ Schemas for tracking agent task execution quality, efficiency, and correctness.
 
 from __future__ import annotations
 
+import functools
+import time
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
 import uuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _sid(n: int = 8) -> str:
+    """n-char random hex id (uuid4().hex skips the hyphenated str() formatting)."""
+    return uuid.uuid4().hex[:n]
+
+
+_UTC = timezone.utc
+
+
+def _now() -> datetime:
+    return datetime.now(_UTC)
+
+
+def _issue_id() -> str:
+    return f"QI-{time.strftime('%Y%m%d%H%M%S', time.gmtime())}-{_sid(4)}"
+
+
+# Shared by every model: unknown keys from older session files are dropped, and the
+# validator/serializer is built on first use rather than at import time.
+_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_assignment=False,
+    arbitrary_types_allowed=True,
+    defer_build=True,
+    ser_json_timedelta="iso8601",
+    ser_json_bytes="base64",
+)
 
 
 # -- Enums --
@@ -66,8 +96,10 @@ class GuardMode(str, Enum):
 
 class TaskDefinition(BaseModel):
     """Definition of the task the agent should accomplish."""
-    
-    task_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+
+    model_config = _MODEL_CONFIG
+
+    task_id: str = Field(default_factory=_sid)
     description: str  # Natural language task description
     expected_tools: list[str] = Field(default_factory=list)  # Tools agent should use
     max_steps: int = 20  # Maximum reasonable steps
@@ -77,10 +109,12 @@ class TaskDefinition(BaseModel):
 
 class StepRecord(BaseModel):
     """Single tool call step in agent execution."""
-    
-    step_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+
+    model_config = _MODEL_CONFIG
+
+    step_id: str = Field(default_factory=_sid)
     step_number: int  # Sequential step counter
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_now)
     tool_name: str
     tool_input: dict[str, Any] = Field(default_factory=dict)
     tool_result: str = ""  # Truncated result
@@ -94,9 +128,11 @@ class StepRecord(BaseModel):
 
 class QualityIssue(BaseModel):
     """A quality problem detected during execution."""
-    
-    issue_id: str = Field(default_factory=lambda: f"QI-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}-{str(uuid.uuid4())[:4]}")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    model_config = _MODEL_CONFIG
+
+    issue_id: str = Field(default_factory=_issue_id)
+    timestamp: datetime = Field(default_factory=_now)
     issue_type: IssueType
     severity: int = Field(ge=1, le=10, default=5)  # 1=minor, 10=critical
     description: str
@@ -107,12 +143,14 @@ class QualityIssue(BaseModel):
 
 class SessionReport(BaseModel):
     """Complete quality and security report for an agent session."""
-    
-    session_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:12])
+
+    model_config = _MODEL_CONFIG
+
+    session_id: str = Field(default_factory=functools.partial(_sid, 12))
     agent_name: str = "unknown"
     model: Optional[str] = None
     task: Optional[TaskDefinition] = None
-    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime = Field(default_factory=_now)
     ended_at: Optional[datetime] = None
     
     # Execution metrics
@@ -160,8 +198,10 @@ class SessionReport(BaseModel):
 
 class TestCase(BaseModel):
     """Automated test case for agent quality."""
-    
-    test_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+
+    model_config = _MODEL_CONFIG
+
+    test_id: str = Field(default_factory=_sid)
     name: str
     description: str
     task: TaskDefinition
@@ -174,23 +214,27 @@ class TestCase(BaseModel):
 
 class TestResult(BaseModel):
     """Result of running a test case."""
-    
-    result_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+
+    model_config = _MODEL_CONFIG
+
+    result_id: str = Field(default_factory=_sid)
     test_case: TestCase
     session_report: SessionReport
     passed: bool = False
     failure_reason: str = ""
     execution_time_seconds: float = 0.0
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_now)
 
 
 # -- Legacy compatibility (for gradual migration) --
 
 class ActionRecord(BaseModel):
     """Legacy action record - maps to StepRecord."""
-    
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    model_config = _MODEL_CONFIG
+
+    id: str = Field(default_factory=_sid)
+    timestamp: datetime = Field(default_factory=_now)
     agent_name: str = "unknown"
     tool_name: str = "unknown"
     tool_input: dict[str, Any] = Field(default_factory=dict)
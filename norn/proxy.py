@@ -4,6 +4,7 @@ Norn Proxy — MonitoredAgent wrapper for Strands agents.
 """
 
 import logging
+import os
 from typing import Optional
 from strands import Agent
 
@@ -12,6 +13,34 @@ from norn.models.schemas import TaskDefinition
 
 logger = logging.getLogger("norn.proxy")
 
+# Read once at import: NORN_DISABLED=true turns every MonitoredAgent into a plain
+# Agent without building a TaskDefinition or NornHook per construction.
+_NORN_DISABLED = os.environ.get("NORN_DISABLED", "").lower() == "true"
+
+
+def _inject_norn_hook(
+    kwargs: dict,
+    mode: str,
+    *,
+    norn_task: Optional[str] = None,
+    enable_ai_eval: bool = True,
+    enable_shadow_browser: bool = False,
+) -> NornHook:
+    """Build a NornHook and append it to the Agent kwargs' hooks list."""
+    task = TaskDefinition(description=norn_task) if norn_task else None
+
+    guard = NornHook(
+        task=task,
+        mode=mode,
+        enable_ai_eval=enable_ai_eval,
+        enable_shadow_browser=enable_shadow_browser,  # Can be enabled via env var
+    )
+    # Copy once and append: the caller's own hooks list must not be mutated.
+    hooks = list(kwargs.get("hooks") or ())
+    hooks.append(guard)
+    kwargs["hooks"] = hooks
+    return guard
+
 
 class MonitoredAgent(Agent):
     """
@@ -40,35 +69,22 @@ class MonitoredAgent(Agent):
         Create agent with automatic Norn monitoring.
         
         Args:
-            norn_enabled: Enable/disable monitoring
+            norn_enabled: Enable/disable monitoring (ignored when NORN_DISABLED=true)
             norn_mode: "monitor" or "intervene"
             norn_task: Task description for quality evaluation
             *args, **kwargs: Standard Agent parameters
         """
-        # Add Norn hook automatically
-        if norn_enabled:
-            task = TaskDefinition(description=norn_task) if norn_task else None
-            guard = NornHook(
-                task=task,
-                mode=norn_mode,
-                enable_ai_eval=True,
-                enable_shadow_browser=False,  # Can be enabled via env var
-            )
-            
-            # Add to hooks
-            existing_hooks = kwargs.get('hooks', [])
-            kwargs['hooks'] = existing_hooks + [guard]
-            
-            # Store guard reference for later access
-            self._norn = guard
-            
+        guard = None
+        if norn_enabled and not _NORN_DISABLED:
+            guard = _inject_norn_hook(kwargs, norn_mode, norn_task=norn_task)
             logger.info("Norn monitoring enabled for agent")
-        else:
-            self._norn = None
-        
+
         # Initialize parent Agent
         super().__init__(*args, **kwargs)
-    
+
+        # Store guard reference for later access (after Agent init so it can't be reset)
+        self._norn = guard
+
     @property
     def quality_report(self):
         """Get Norn quality report."""
@@ -2,18 +2,13 @@
 norn/routers/agents_hook.py — Hook agent registration endpoint.
 """
 
-import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
 
-from norn.shared import (
-    REGISTRY_FILE,
-    _atomic_write_json,
-    _registry_lock,
-)
+from norn.shared import _read_registry, _registry_writer
 
 router = APIRouter()
 logger = logging.getLogger("norn.api")
@@ -26,44 +21,51 @@ def register_hook_agent(data: Dict[str, Any]) -> Dict[str, Any]:
     if not name:
         raise HTTPException(status_code=400, detail="name is required")
 
-    with _registry_lock:
-        REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
-        agents: List[Dict[str, Any]] = []
-        if REGISTRY_FILE.exists():
-            try:
-                with open(REGISTRY_FILE) as f:
-                    agents = json.load(f)
-            except Exception:
-                agents = []
+    def _existing(agents: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return next(
+            (a for a in agents if a.get("name") == name and a.get("source") == "hook"),
+            None,
+        )
 
-        # Return existing hook agent with this name
-        for agent in agents:
-            if agent.get("name") == name and agent.get("source") == "hook":
-                return agent
+    # Return existing hook agent with this name (cached read, no write queued)
+    existing = _existing(_read_registry())
+    if existing:
+        return existing
 
-        # Create new hook agent entry
-        agent_id = f"hook-{datetime.now().strftime('%Y%m%d%H%M%S')}-{name.lower().replace(' ', '_')[:20]}"
-        agent_info: Dict[str, Any] = {
-            "id": agent_id,
-            "name": name,
-            "source": "hook",
-            "source_file": data.get("source_file", "unknown.py"),
-            "task_description": data.get("task_description", f"Live monitoring: {name}"),
-            "added_at": datetime.now().isoformat(),
-            "status": "analyzed",
-            "discovery": {
-                "agent_type": "Hook Agent",
-                "tools": [],
-                "functions": [],
-                "imports": [],
-                "dependencies": [],
-                "potential_issues": [],
-                "entry_points": [],
-            },
-        }
+    # Create new hook agent entry
+    now = datetime.now()
+    agent_id = f"hook-{now.strftime('%Y%m%d%H%M%S')}-{name.lower().replace(' ', '_')[:20]}"
+    agent_info: Dict[str, Any] = {
+        "id": agent_id,
+        "name": name,
+        "source": "hook",
+        "source_file": data.get("source_file", "unknown.py"),
+        "task_description": data.get("task_description", f"Live monitoring: {name}"),
+        "added_at": now.isoformat(),
+        "status": "analyzed",
+        "discovery": {
+            "agent_type": "Hook Agent",
+            "tools": [],
+            "functions": [],
+            "imports": [],
+            "dependencies": [],
+            "potential_issues": [],
+            "entry_points": [],
+        },
+    }
 
-        agents.append(agent_info)
-        _atomic_write_json(REGISTRY_FILE, agents)
+    # Re-check inside the coalesced write so two concurrent registrations of the
+    # same name still produce one entry
+    registered: List[Dict[str, Any]] = []
+
+    def _register(agents: list) -> list:
+        found = _existing(agents)
+        registered.append(found or agent_info)
+        return agents if found else agents + [agent_info]
+
+    _registry_writer.mutate(_register)
+    if registered[0] is not agent_info:
+        return registered[0]
 
     logger.info("Hook agent registered: %s (%s)", name, agent_id)
     return agent_info
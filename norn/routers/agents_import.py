@@ -3,36 +3,91 @@ norn/routers/agents_import.py — GitHub and ZIP agent import routes.
 """
 
 import ast
-import json
+import asyncio
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
-import uuid
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 
 from norn.shared import (
     REGISTRY_FILE,
-    _atomic_write_json,
+    _fast_id,
     _read_registry,
-    _registry_lock,
+    _registry_writer,
     _safe_extract,
     verify_api_key,
 )
 from norn.execution.discovery import _discover_and_install_deps, _run_discovery_only
-from norn.execution.task_gen import _generate_auto_task
+from norn.execution.task_gen import _generate_auto_tasks_batch
 from norn.import_utils.pyproject import _find_main_file_from_pyproject
-from norn.import_utils.file_detection import _is_agent_file, _derive_agent_name
+from norn.import_utils.file_detection import (
+    _AGENT_NAME_RE,
+    _SKIP_DIRS,
+    _derive_agent_name,
+    _is_agent_file,
+    _parse_path,
+)
 
 router = APIRouter()
 logger = logging.getLogger("norn.api")
 
+def _git_env() -> Dict[str, str]:
+    """Current environment, but never block on a credential prompt — private repos fail fast."""
+    return {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+_ROOT_ENTRY_POINTS = ("main.py", "agent.py", "app.py", "run.py", "__main__.py")
+
+
+def _find_shallowest_agent_file(root: Path, max_depth: int) -> Optional[Path]:
+    """Breadth-first search for an agent file, at most max_depth path parts below root.
+
+    Works through the shallowest depth that has one, stopping there instead of
+    classifying every .py file in the repo. Within a depth, entry-point-like names
+    (_AGENT_NAME_RE) are parsed first, then the rest, each alphabetically. Vendored
+    and build directories (_SKIP_DIRS) are never descended into.
+    """
+    level = [root]
+    for _depth in range(max_depth):
+        files: List[os.DirEntry] = []
+        subdirs: List[Path] = []
+        for directory in level:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                subdirs.append(Path(entry.path))
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            files.append(entry)
+            except OSError:
+                continue
+        files.sort(key=lambda e: (not _AGENT_NAME_RE.match(e.name), e.name))
+        for entry in files:
+            if _is_agent_file(Path(entry.path)):
+                return Path(entry.path)
+        level = subdirs
+    return None
+
+
+def _git_clone_cmd(repo_url: str, dest: Path, branch: Optional[str] = None) -> List[str]:
+    """Shallow, blobless, single-branch clone — discovery only needs the tip snapshot."""
+    cmd = [
+        "git", "-c", "core.fsmonitor=false", "clone",
+        "--depth=1", "--filter=blob:none", "--single-branch", "--no-tags",
+    ]
+    if branch:
+        cmd += ["-b", branch]
+    return cmd + [repo_url, str(dest)]
+
 
 @router.post("/api/agents/import/github", dependencies=[Depends(verify_api_key)])
 def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -71,8 +126,8 @@ def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         if not branch_from_url and not data.get("branch"):
             try:
                 ls_result = subprocess.run(
-                    ["git", "ls-remote", "--symref", repo_url, "HEAD"],
-                    capture_output=True, text=True, timeout=15
+                    ["git", "-c", "core.fsmonitor=false", "ls-remote", "--symref", repo_url, "HEAD"],
+                    capture_output=True, text=True, timeout=15, env=_git_env(),
                 )
                 if ls_result.returncode == 0 and "refs/heads/" in ls_result.stdout:
                     for line in ls_result.stdout.splitlines():
@@ -89,17 +144,19 @@ def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         repo_root = clone_path  # Preserve repo root before subfolder navigation
 
         result = subprocess.run(
-            ["git", "clone", "-b", branch, repo_url, str(clone_path)],
+            _git_clone_cmd(repo_url, clone_path, branch),
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=60,
+            env=_git_env(),
         )
 
         # Fallback: if branch not found, clone without -b (uses repo default)
         if result.returncode != 0:
+            shutil.rmtree(clone_path, ignore_errors=True)
             fallback_result = subprocess.run(
-                ["git", "clone", repo_url, str(clone_path)],
-                capture_output=True, text=True, timeout=60
+                _git_clone_cmd(repo_url, clone_path),
+                capture_output=True, text=True, timeout=60, env=_git_env(),
             )
             if fallback_result.returncode != 0:
                 raise Exception(f"Git clone failed: {result.stderr}")
@@ -125,20 +182,15 @@ def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
                 # Always ONE card per repo import.
                 # Pick the single best entry point; discovery runs on the whole clone_path dir.
                 # Priority: main.py > agent.py > app.py > run.py > __main__.py > first found
-                _ROOT_ENTRY_POINTS = ("main.py", "agent.py", "app.py", "run.py", "__main__.py")
+                with os.scandir(clone_path) as it:
+                    top_files = {e.name for e in it if e.is_file()}
                 root_entry = next(
-                    (clone_path / ep for ep in _ROOT_ENTRY_POINTS
-                     if (clone_path / ep).exists()),
+                    (clone_path / ep for ep in _ROOT_ENTRY_POINTS if ep in top_files),
                     None,
                 )
                 if root_entry is None:
-                    # Fallback: deepest-last agent file in the repo
-                    all_found = sorted([
-                        p for p in clone_path.rglob("*.py")
-                        if len(p.relative_to(clone_path).parts) <= 4
-                        and _is_agent_file(p)
-                    ], key=lambda p: (len(p.relative_to(clone_path).parts), p.name))
-                    root_entry = all_found[0] if all_found else None
+                    # Fallback: shallowest agent file in the repo
+                    root_entry = _find_shallowest_agent_file(clone_path, max_depth=4)
 
                 candidate_files = [root_entry] if root_entry else []
 
@@ -152,6 +204,7 @@ def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         prefix = data.get("agent_name", "").strip()
         now = datetime.now()
         timestamp_base = now.strftime('%Y%m%d%H%M%S')
+        added_at = now.isoformat()
         created_agents: List[Dict[str, Any]] = []
 
         # Load existing registry once (short lock — git clone happens outside)
@@ -163,6 +216,8 @@ def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         first_rel = str(candidate_files[0].relative_to(clone_path))
         first_discovery = _discover_and_install_deps(clone_path, first_rel)
 
+        task_requests: List[Any] = []  # (agent_info, (name, discovery, task, path))
+
         for i, candidate in enumerate(candidate_files):
             rel_main = str(candidate.relative_to(clone_path))
             safe_stem = candidate.stem.lower().replace("_", "-")[:32]
@@ -192,35 +247,35 @@ def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
                 "task_description": task_description,
                 "clone_path": str(clone_path),
                 "repo_root": str(repo_root),
-                "added_at": now.isoformat(),
+                "added_at": added_at,
                 "status": "analyzing",
             }
 
             agent_info["status"] = discovery_info.get("status", "ready")
             if "discovery" in discovery_info:
                 agent_info["discovery"] = discovery_info["discovery"]
-                auto_task = _generate_auto_task(agent_name, discovery_info["discovery"], task_description, clone_path)
-                agent_info["task_description"] = auto_task
+                task_requests.append((
+                    agent_info,
+                    (agent_name, discovery_info["discovery"], task_description, clone_path),
+                ))
 
             agents_list.append(agent_info)
             created_agents.append(agent_info)
 
-        # Write registry — re-read under lock to merge with any concurrent imports
+        # Generate auto-tasks for all candidates in one concurrent batch
+        if task_requests:
+            auto_tasks = asyncio.run(_generate_auto_tasks_batch([req for _, req in task_requests]))
+            for (agent_info, _), auto_task in zip(task_requests, auto_tasks):
+                agent_info["task_description"] = auto_task
+
+        # Write registry — merged into the current file by the coalescing writer
         _captured_agents = list(created_agents)
-        with _registry_lock:
-            current = []
-            if REGISTRY_FILE.exists():
-                try:
-                    with open(REGISTRY_FILE) as f:
-                        current = json.load(f)
-                except (json.JSONDecodeError, OSError):
-                    current = []
+
+        def _merge_created(current: list) -> list:
             current_ids = {a["id"] for a in current}
-            for a in _captured_agents:
-                if a["id"] not in current_ids:
-                    current.append(a)
-            REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
-            _atomic_write_json(REGISTRY_FILE, current)
+            return current + [a for a in _captured_agents if a["id"] not in current_ids]
+
+        _registry_writer.mutate(_merge_created)
 
         return created_agents
 
@@ -235,59 +290,72 @@ def import_github_agent(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _extract_zip_agent(
+    fileobj, temp_dir: Path, extract_path: Path, agent_name: str, main_file: Optional[str],
+) -> Tuple[str, str]:
+    """Blocking part of the ZIP import: extract, then return (main_file, task_description)."""
+    # Copy the upload to a real file in chunks — SpooledTemporaryFile is not
+    # seekable() before Python 3.11, which ZipFile requires
+    zip_path = temp_dir / "upload.zip"
+    with open(zip_path, "wb") as out:
+        shutil.copyfileobj(fileobj, out, 1 << 20)
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            _safe_extract(zip_ref, extract_path)
+    finally:
+        zip_path.unlink(missing_ok=True)
+
+    # Auto-detect main file if not provided
+    if not main_file:
+        candidates = ["agent.py", "main.py", "app.py", "run.py"]
+        for candidate in candidates:
+            if (extract_path / candidate).exists():
+                main_file = candidate
+                break
+
+        if not main_file:
+            for py_file in extract_path.rglob("*.py"):
+                name = py_file.name.lower()
+                if 'agent' in name or 'main' in name:
+                    main_file = str(py_file.relative_to(extract_path))
+                    break
+
+        if not main_file:
+            raise Exception("Could not auto-detect main file")
+
+    # Auto-detect task description
+    agent_file = extract_path / main_file
+    task_description = f"Execute {agent_name}"
+    try:
+        # Shared AST cache — the same tree is reused by task-prompt enrichment
+        docstring = ast.get_docstring(_parse_path(agent_file))
+        if docstring:
+            task_description = docstring.split('\n')[0].strip()
+    except Exception:
+        pass
+    return main_file, task_description
+
+
 @router.post("/api/agents/import/zip", dependencies=[Depends(verify_api_key)])
 async def import_zip_agent(file: UploadFile = File(...), agent_name: str = Form(...), main_file: Optional[str] = Form(None)) -> Dict[str, Any]:
     """Import agent from uploaded ZIP file"""
     try:
-        import io
-
-        # Read uploaded file
-        file_content = await file.read()
-
         # Create temp directory for extraction
         temp_dir = Path(tempfile.mkdtemp())
         extract_path = temp_dir / "agent_files"
         extract_path.mkdir(parents=True, exist_ok=True)
 
-        # Extract ZIP (BUG-005: safe extract prevents path traversal attacks)
-        zip_buffer = io.BytesIO(file_content)
-        with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
-            _safe_extract(zip_ref, extract_path)
-
-        # Auto-detect main file if not provided
-        if not main_file:
-            candidates = ["agent.py", "main.py", "app.py", "run.py"]
-            for candidate in candidates:
-                if (extract_path / candidate).exists():
-                    main_file = candidate
-                    break
-
-            if not main_file:
-                for py_file in extract_path.rglob("*.py"):
-                    name = py_file.name.lower()
-                    if 'agent' in name or 'main' in name:
-                        main_file = str(py_file.relative_to(extract_path))
-                        break
-
-            if not main_file:
-                raise Exception("Could not auto-detect main file")
-
-        # Auto-detect task description
-        agent_file = extract_path / main_file
-        task_description = f"Execute {agent_name}"
-        try:
-            with open(agent_file) as f:
-                content = f.read()
-                tree = ast.parse(content)
-                docstring = ast.get_docstring(tree)
-                if docstring:
-                    task_description = docstring.split('\n')[0].strip()
-        except Exception:
-            pass
+        # Stream the upload to disk and extract from there, so the archive is
+        # never held in memory.
+        # BUG-005: safe extract prevents path traversal attacks
+        await file.seek(0)
+        main_file, task_description = await asyncio.to_thread(
+            _extract_zip_agent, file.file, temp_dir, extract_path, agent_name, main_file,
+        )
 
         # Create agent entry
         agent_info = {
-            "id": f"zip-{uuid.uuid4().hex[:12]}",
+            "id": _fast_id("zip"),
             "name": agent_name,
             "source": "zip",
             "main_file": main_file,
@@ -299,26 +367,18 @@ async def import_zip_agent(file: UploadFile = File(...), agent_name: str = Form(
         }
 
         # Run discovery and install dependencies
-        discovery_info = _discover_and_install_deps(extract_path, main_file)
+        discovery_info = await asyncio.to_thread(_discover_and_install_deps, extract_path, main_file)
         agent_info["status"] = discovery_info["status"]
         if "discovery" in discovery_info:
             agent_info["discovery"] = discovery_info["discovery"]
             # Generate auto-task based on discovered capabilities
-            auto_task = _generate_auto_task(agent_name, discovery_info["discovery"], task_description, extract_path)
-            agent_info["task_description"] = auto_task
-
-        # Save to registry — under lock to prevent concurrent import clobber
-        with _registry_lock:
-            REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
-            agents = []
-            if REGISTRY_FILE.exists():
-                try:
-                    with open(REGISTRY_FILE) as f:
-                        agents = json.load(f)
-                except (json.JSONDecodeError, OSError):
-                    agents = []
-            agents.append(agent_info)
-            _atomic_write_json(REGISTRY_FILE, agents)
+            auto_tasks = await _generate_auto_tasks_batch(
+                [(agent_name, discovery_info["discovery"], task_description, extract_path)]
+            )
+            agent_info["task_description"] = auto_tasks[0]
+
+        # Save to registry — the coalescing writer serializes concurrent imports
+        await asyncio.to_thread(_registry_writer.mutate, lambda agents: agents + [agent_info])
 
         return agent_info
 
@@ -2,26 +2,31 @@
 norn/routers/agents_registry.py — Agent registry read & delete routes.
 """
 
-import json
 import logging
+import os
 import shutil
-from pathlib import Path
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
 
 from norn.shared import (
     REGISTRY_FILE,
-    SESSIONS_DIR,
-    _atomic_write_json,
+    _load_json,
+    _map_io,
     _read_registry,
-    _registry_lock,
+    _read_registry_indexed,
+    _registry_writer,
+    _remove_session_files,
+    _scandir_sessions,
     verify_api_key,
 )
 
 router = APIRouter()
 logger = logging.getLogger("norn.api")
 
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="norn-cleanup")
+
 
 @router.get("/api/agents", dependencies=[Depends(verify_api_key)])
 def get_agents() -> List[Dict[str, Any]]:
@@ -32,8 +37,7 @@ def get_agents() -> List[Dict[str, Any]]:
 @router.get("/api/agents/{agent_id}", dependencies=[Depends(verify_api_key)])
 def get_agent(agent_id: str) -> Dict[str, Any]:
     """Get specific agent details"""
-    agents = _read_registry()
-    agent = next((a for a in agents if a["id"] == agent_id), None)
+    agent = _read_registry_indexed()[1].get(agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
     return agent
@@ -45,45 +49,48 @@ def delete_agent(agent_id: str) -> Dict[str, str]:
     if not REGISTRY_FILE.exists():
         raise HTTPException(status_code=404, detail="No agents registered")
 
+    # Cheap 404 from the cached index before queuing a registry write
+    if agent_id not in _read_registry_indexed()[1]:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
     try:
-        with _registry_lock:
-            with open(REGISTRY_FILE) as f:
-                agents = json.load(f)
+        removed: List[Dict[str, Any]] = []
 
+        def _remove(agents: list) -> list:
             agent = next((a for a in agents if a["id"] == agent_id), None)
             if not agent:
                 raise HTTPException(status_code=404, detail="Agent not found")
+            removed.append(agent)
+            return [a for a in agents if a["id"] != agent_id]
 
-            # Remove from registry
-            agents = [a for a in agents if a["id"] != agent_id]
-            _atomic_write_json(REGISTRY_FILE, agents)
+        _registry_writer.mutate(_remove)
+        agent = removed[0]
 
         # Delete associated session files (and their audit logs)
         agent_name = agent.get("name")
-        if agent_name and SESSIONS_DIR.exists():
-            for f in SESSIONS_DIR.glob("*.json"):
+        if agent_name:
+            def _remove_if_owned(item: Tuple[str, Any]) -> None:
                 try:
-                    with open(f) as fp:
-                        data = json.load(fp)
-                    if data.get("agent_name") == agent_name:
-                        f.unlink()
+                    if _load_json(item[0]).get("agent_name") == agent_name:
+                        _remove_session_files(item[0])
                 except Exception:
                     pass
 
+            # Session files are read on the shared I/O pool
+            _map_io(_remove_if_owned, _scandir_sessions())
+
         # Clean up temp files — only for git/zip agents, never for hook agents
-        # (done outside the lock since it can be slow)
-        if agent.get("source") == "git":
-            path = Path(agent.get("clone_path", ""))
-            # clone_path is temp_dir/agent_repo — delete temp_dir (parent)
-            cleanup_dir = path.parent if path and path.parent.name else path
-            if cleanup_dir and cleanup_dir.exists():
-                shutil.rmtree(cleanup_dir, ignore_errors=True)
-        elif agent.get("source") == "zip":
-            path = Path(agent.get("extract_path", ""))
-            # extract_path is temp_dir/agent_files — delete temp_dir (parent)
-            cleanup_dir = path.parent if path and path.parent.name else path
-            if cleanup_dir and cleanup_dir.exists():
-                shutil.rmtree(cleanup_dir, ignore_errors=True)
+        # (off the request thread since a large clone can take seconds to remove)
+        path_key = {"git": "clone_path", "zip": "extract_path"}.get(agent.get("source"))
+        if path_key:
+            path = agent.get(path_key) or ""
+            # clone_path / extract_path is temp_dir/<subdir> — delete temp_dir (parent)
+            parent = os.path.dirname(path)
+            cleanup_dir = parent if os.path.basename(parent) else path
+            if cleanup_dir and os.path.exists(cleanup_dir):
+                _CLEANUP_POOL.submit(shutil.rmtree, cleanup_dir, True).add_done_callback(
+                    lambda fut, d=cleanup_dir: logger.info(f"Removed agent files {d}")
+                )
 
         return {"status": "deleted", "id": agent_id}
 
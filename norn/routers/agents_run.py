@@ -3,27 +3,25 @@ norn/routers/agents_run.py — Agent execution route (thin shell).
 
 Heavy execution logic lives in norn.execution.runner.
 This module only handles the HTTP contract: validate the request,
-create the initial session record, flip agent status, and spawn the thread.
+create the initial session record, flip agent status, and start the run.
 """
 
-import json
 import logging
-import threading
+import os
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException
 
 from norn.shared import (
-    REGISTRY_FILE,
     SESSIONS_DIR,
     _atomic_write_json,
-    _read_registry,
-    _registry_lock,
+    _fast_id,
+    _read_registry_indexed,
+    _registry_writer,
     verify_api_key,
 )
-from norn.execution.runner import _execute_agent_background
+from norn.execution.runner import _start_agent_run
 
 router = APIRouter()
 logger = logging.getLogger("norn.api")
@@ -36,20 +34,20 @@ def run_agent(agent_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     if not task:
         raise HTTPException(status_code=400, detail="task is required")
 
-    agents = _read_registry()
-    agent = next((a for a in agents if a["id"] == agent_id), None)
+    agent = _read_registry_indexed()[1].get(agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
+    session_file = None
     try:
-        session_id = f"{agent_id}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        started_at = datetime.now().isoformat()
+        session_id = _fast_id(agent_id)
 
-        agent_path = Path(agent.get("clone_path") or agent.get("extract_path", ""))
-        if not agent_path.exists():
+        agent_path = agent.get("clone_path") or agent.get("extract_path") or ""
+        if not os.path.exists(agent_path):
             raise HTTPException(status_code=400, detail="Agent files not found")
 
-        main_file_path = agent_path / agent["main_file"]
-        if not main_file_path.exists():
+        if not os.path.exists(os.path.join(agent_path, agent["main_file"])):
             raise HTTPException(
                 status_code=400,
                 detail=f"Main file not found: {agent['main_file']}",
@@ -61,8 +59,10 @@ def run_agent(agent_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
             "agent_name": agent["name"],
             "agent_id": agent_id,
             "task": task,
-            "started_at": datetime.now().isoformat(),
-            "status": "active",
+            # Restamped (and flipped to "active") when a run slot picks it up
+            "started_at": started_at,
+            "queued_at": started_at,
+            "status": "queued",
             "total_steps": 0,
             "steps": [],
             "issues": [],
@@ -71,38 +71,29 @@ def run_agent(agent_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
             "security_score": None,
         }
         SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
-        _atomic_write_json(SESSIONS_DIR / f"{session_id}.json", session_data)
-
-        # Flip agent status to "running" — under lock to prevent race
-        with _registry_lock:
-            _agents: list = []
-            if REGISTRY_FILE.exists():
-                try:
-                    with open(REGISTRY_FILE) as f:
-                        _agents = json.load(f)
-                except (json.JSONDecodeError, OSError):
-                    _agents = []
-            for a in _agents:
+        session_file = SESSIONS_DIR / f"{session_id}.json"
+        _atomic_write_json(session_file, session_data)
+
+        # Flip agent status to "running" — applied by the coalescing registry writer
+        def _mark_running(agents: list) -> list:
+            for a in agents:
                 if a["id"] == agent_id:
                     a["status"] = "running"
-                    a["last_run"] = datetime.now().isoformat()
+                    a["last_run"] = started_at
                     break
-            _atomic_write_json(REGISTRY_FILE, _agents)
-
-        # Launch background thread
-        thread = threading.Thread(
-            target=_execute_agent_background,
-            args=(
-                agent_id,
-                session_id,
-                str(agent_path),
-                agent["main_file"],
-                task,
-                agent.get("repo_root", str(agent_path)),
-            ),
-            daemon=True,
+            return agents
+
+        _registry_writer.mutate(_mark_running)
+
+        # Launch background run (queued if NORN_MAX_CONCURRENT runs are active)
+        _start_agent_run(
+            agent_id,
+            session_id,
+            agent_path,
+            agent["main_file"],
+            task,
+            agent.get("repo_root", agent_path),
         )
-        thread.start()
 
         return {
             "status": "started",
@@ -114,4 +105,13 @@ def run_agent(agent_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as exc:
+        # Don't leave a "queued" session behind for a run that was never dispatched
+        if session_file is not None:
+            session_data["status"] = "terminated"
+            session_data["overall_quality"] = "FAILED"
+            session_data["ended_at"] = datetime.now().isoformat()
+            try:
+                _atomic_write_json(session_file, session_data)
+            except OSError:
+                pass
         raise HTTPException(status_code=500, detail=str(exc))
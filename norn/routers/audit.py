@@ -2,19 +2,228 @@
 norn/routers/audit.py — Audit log endpoint.
 """
 
-import json
+import heapq
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
-
-from norn.shared import SESSIONS_DIR, _atomic_write_json, _load_config, verify_api_key
+from fastapi.responses import Response
+
+try:
+    import ijson
+except ImportError:  # optional — installed with the [api] extra
+    ijson = None  # type: ignore[assignment]
+
+from norn.shared import (
+    SESSIONS_DIR,
+    _SessionSig,
+    _get_session_lock,
+    _json_response,
+    _load_config,
+    _load_session,
+    _map_io,
+    _remove_session_files,
+    _scandir_sessions,
+    verify_api_key,
+)
+from norn.routers.sessions import _save_session
 
 router = APIRouter()
 logger = logging.getLogger("norn.api")
 
 
+# ── Per-session event cache ──────────────────────────────
+# path -> (session signature, session_id, agent_name, [(sort key, event)]).
+# Validated by stat, since session files are also written outside this router.
+# Cached events are shared between requests and must not be mutated.
+_EventList = List[Tuple[datetime, Dict[str, Any]]]
+_EVENT_CACHE: Dict[str, Tuple[_SessionSig, str, str, _EventList]] = {}
+_EVENT_CACHE_MAX = 4096
+
+# ── Severity tables ──────────────────────────────────────
+# A step's severity is the worse of its score level and its status level.
+_SEVERITY_LEVELS = ("info", "warning", "critical")
+_STATUS_LEVEL = {"IRRELEVANT": 1, "REDUNDANT": 1, "FAILED": 2, "BLOCKED": 2}
+_QUALITY_SEVERITY = {"EXCELLENT": "info", "GOOD": "info", "POOR": "warning"}
+
+# ── Streaming reads ──────────────────────────────────────
+# Session files above this size are parsed incrementally with ijson, keeping only
+# the fields _build_session_events() reads (tool inputs/results are skipped).
+_STREAM_THRESHOLD = 1 << 20
+_SESSION_EVENT_FIELDS = frozenset((
+    "session_id", "agent_name", "model", "task", "started_at", "start_time",
+    "ended_at", "end_time", "issues", "overall_quality", "efficiency_score",
+    "security_score",
+))
+_STEP_EVENT_FIELDS = frozenset((
+    "step_id", "timestamp", "tool_name", "status", "security_score",
+    "relevance_score", "reasoning",
+))
+_STEP_PREFIX = "steps.item."
+
+
+def _parse_ts(ts_str: str, local_tz) -> datetime:
+    """Parse ISO timestamp; assume local timezone if no tz info."""
+    try:
+        dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=local_tz)
+        return dt
+    except (ValueError, TypeError, AttributeError):
+        return datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _stream_event_fields(path: str) -> Dict[str, Any]:
+    """The subset of a session JSON used for audit events, read in one ijson pass."""
+    session: Dict[str, Any] = {}
+    steps: List[Dict[str, Any]] = []
+    builder = None
+    depth = 0
+    target: Dict[str, Any] = session
+    key = ""
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                # Inside a selected container — feed it until it closes
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                    if depth == 0:
+                        target[key] = builder.value
+                        builder = None
+                continue
+            if event == "map_key":
+                continue
+            if prefix.startswith(_STEP_PREFIX):
+                target, key = steps[-1], prefix[len(_STEP_PREFIX):]
+                if key not in _STEP_EVENT_FIELDS:
+                    continue
+            elif prefix == "steps.item":
+                if event == "start_map":
+                    steps.append({})
+                continue
+            elif prefix in _SESSION_EVENT_FIELDS:
+                target, key = session, prefix
+            else:
+                continue
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            else:
+                target[key] = value
+    session["steps"] = steps
+    return session
+
+
+def _build_session_events(session: Dict[str, Any]) -> Tuple[str, str, _EventList]:
+    """Audit events for one session, each paired with its timestamp sort key."""
+    events: List[Dict[str, Any]] = []
+    sid = session.get("session_id", "")
+    agent = session.get("agent_name", "Unknown")
+
+    # Extract model (clean up Python repr strings)
+    model = session.get("model") or "Unknown"
+    if isinstance(model, str) and model.startswith("<") and model.endswith(">"):
+        parts = model.strip("<>").split(" object at ")[0]
+        model = parts.rsplit(".", 1)[-1] if "." in parts else parts
+
+    # Session start event
+    start_time = session.get("started_at") or session.get("start_time", "")
+    if start_time:
+        events.append({
+            "id": f"{sid}-start",
+            "timestamp": start_time,
+            "event_type": "session_start",
+            "session_id": sid,
+            "agent_name": agent,
+            "model": model,
+            "summary": f"Session started – {(session.get('task', {}).get('description', '') if isinstance(session.get('task'), dict) else str(session.get('task', '')))[:80]}",
+            "severity": "info",
+        })
+
+    # Step-level events
+    for step_idx, step in enumerate(session.get("steps", [])):
+        ts = step.get("timestamp", start_time)
+        tool = step.get("tool_name", "unknown")
+        status = step.get("status", "SUCCESS")
+        sec = step.get("security_score", 100)
+        rel = step.get("relevance_score", 100)
+
+        score_level = 0 if sec is None else (2 if sec < 70 else (1 if sec < 90 else 0))
+        severity = _SEVERITY_LEVELS[max(score_level, _STATUS_LEVEL.get(status, 0))]
+
+        events.append({
+            "id": step.get("step_id") or f"{sid}-step-{step_idx}",
+            "timestamp": ts,
+            "event_type": "tool_call",
+            "session_id": sid,
+            "agent_name": agent,
+            "model": model,
+            "summary": f"{tool}() → {status}  |  Security: {sec if sec is not None else 'N/A'}%  Relevance: {rel if rel is not None else 'N/A'}%",
+            "severity": severity,
+            "detail": step.get("reasoning", ""),
+        })
+
+    # Compute end_time early (needed for issue timestamp fallback)
+    end_time = session.get("ended_at") or session.get("end_time")
+
+    # Issue events (use end_time as fallback — issues are generated at session end)
+    for issue_idx, issue in enumerate(session.get("issues", [])):
+        if isinstance(issue, dict):
+            sev_num = issue.get("severity", 5)
+            severity = "critical" if sev_num >= 8 else ("warning" if sev_num >= 5 else "info")
+            events.append({
+                "id": issue.get("issue_id") or f"{sid}-issue-{issue_idx}",
+                "timestamp": issue.get("timestamp", end_time or start_time),
+                "event_type": "issue",
+                "session_id": sid,
+                "agent_name": agent,
+                "model": model,
+                "summary": f"[{issue.get('issue_type', 'UNKNOWN')}] {issue.get('description', '')}",
+                "severity": severity,
+                "detail": issue.get("recommendation", ""),
+            })
+
+    # Session end event
+    if end_time:
+        quality = session.get("overall_quality", "GOOD")
+        severity = _QUALITY_SEVERITY.get(quality, "critical")
+        events.append({
+            "id": f"{sid}-end",
+            "timestamp": end_time,
+            "event_type": "session_end",
+            "session_id": sid,
+            "agent_name": agent,
+            "model": model,
+            "summary": f"Session ended – Quality: {quality}, Efficiency: {session.get('efficiency_score', 0)}%, Security: {session.get('security_score', 'N/A')}{'%' if session.get('security_score') is not None else ''}",
+            "severity": severity,
+        })
+
+    local_tz = datetime.now(timezone.utc).astimezone().tzinfo
+    keyed = [(_parse_ts(e.get("timestamp", ""), local_tz), e) for e in events]
+    return sid, agent, keyed
+
+
+def _session_events(path: str, sig: _SessionSig) -> Tuple[str, str, _EventList]:
+    """_build_session_events() for the session at path, cached while its signature is unchanged."""
+    cached = _EVENT_CACHE.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1], cached[2], cached[3]
+    if ijson is not None and sig[1] > _STREAM_THRESHOLD:
+        session = _load_session(path, _stream_event_fields)
+    else:
+        session = _load_session(path)
+    sid, agent, keyed = _build_session_events(session)
+    if len(_EVENT_CACHE) >= _EVENT_CACHE_MAX:
+        _EVENT_CACHE.clear()
+    _EVENT_CACHE[path] = (sig, sid, agent, keyed)
+    return sid, agent, keyed
+
+
 @router.get("/api/audit-logs", dependencies=[Depends(verify_api_key)])
 def get_audit_logs(
     limit: int = 200,
@@ -23,30 +232,25 @@ def get_audit_logs(
     session_id: str | None = None,
     event_type: str | None = None,
     severity_filter: str | None = None,
-) -> List[Dict[str, Any]]:
+) -> Response:
     """Get chronological audit log events extracted from all sessions"""
     if not SESSIONS_DIR.exists():
-        return []
+        return _json_response([])
 
     config = _load_config()
     effective_max = max_sessions or config.get("audit_max_sessions", 100)
 
-    events: List[Dict[str, Any]] = []
-    session_files = sorted(
-        SESSIONS_DIR.glob("*.json"),
-        key=lambda f: f.stat().st_mtime,
-        reverse=True,
-    )
-
-    for file in session_files[:effective_max]:
+    def _load(item: Tuple[str, _SessionSig]) -> Optional[Tuple[str, str, _EventList]]:
         try:
-            with open(file) as f:
-                session = json.load(f)
+            return _session_events(*item)
         except Exception:
-            continue
+            return None
 
-        sid = session.get("session_id", "")
-        agent = session.get("agent_name", "Unknown")
+    keyed: _EventList = []
+    for loaded in _map_io(_load, _scandir_sessions()[:effective_max]):
+        if loaded is None:
+            continue
+        sid, agent, session_events = loaded
 
         # Skip entire session if filters exclude it
         if agent_name and agent != agent_name:
@@ -54,116 +258,18 @@ def get_audit_logs(
         if session_id and sid != session_id:
             continue
 
-        # Extract model (clean up Python repr strings)
-        model = session.get("model") or "Unknown"
-        if isinstance(model, str) and model.startswith("<") and model.endswith(">"):
-            parts = model.strip("<>").split(" object at ")[0]
-            model = parts.rsplit(".", 1)[-1] if "." in parts else parts
-
-        # Session start event
-        start_time = session.get("started_at") or session.get("start_time", "")
-        if start_time:
-            events.append({
-                "id": f"{sid}-start",
-                "timestamp": start_time,
-                "event_type": "session_start",
-                "session_id": sid,
-                "agent_name": agent,
-                "model": model,
-                "summary": f"Session started – {(session.get('task', {}).get('description', '') if isinstance(session.get('task'), dict) else str(session.get('task', '')))[:80]}",
-                "severity": "info",
-            })
-
-        # Step-level events
-        for step_idx, step in enumerate(session.get("steps", [])):
-            ts = step.get("timestamp", start_time)
-            tool = step.get("tool_name", "unknown")
-            status = step.get("status", "SUCCESS")
-            sec = step.get("security_score", 100)
-            rel = step.get("relevance_score", 100)
-
-            severity = "info"
-            if sec is not None and sec < 70:
-                severity = "critical"
-            elif sec is not None and sec < 90:
-                severity = "warning"
-            # Status check — independent, escalate if worse
-            if status in ("FAILED", "BLOCKED"):
-                severity = "critical"
-            elif status in ("IRRELEVANT", "REDUNDANT") and severity == "info":
-                severity = "warning"
-
-            events.append({
-                "id": step.get("step_id") or f"{sid}-step-{step_idx}",
-                "timestamp": ts,
-                "event_type": "tool_call",
-                "session_id": sid,
-                "agent_name": agent,
-                "model": model,
-                "summary": f"{tool}() → {status}  |  Security: {sec if sec is not None else 'N/A'}%  Relevance: {rel if rel is not None else 'N/A'}%",
-                "severity": severity,
-                "detail": step.get("reasoning", ""),
-            })
-
-        # Compute end_time early (needed for issue timestamp fallback)
-        end_time = session.get("ended_at") or session.get("end_time")
-
-        # Issue events (use end_time as fallback — issues are generated at session end)
-        for issue_idx, issue in enumerate(session.get("issues", [])):
-            if isinstance(issue, dict):
-                sev_num = issue.get("severity", 5)
-                severity = "critical" if sev_num >= 8 else ("warning" if sev_num >= 5 else "info")
-                events.append({
-                    "id": issue.get("issue_id") or f"{sid}-issue-{issue_idx}",
-                    "timestamp": issue.get("timestamp", end_time or start_time),
-                    "event_type": "issue",
-                    "session_id": sid,
-                    "agent_name": agent,
-                    "model": model,
-                    "summary": f"[{issue.get('issue_type', 'UNKNOWN')}] {issue.get('description', '')}",
-                    "severity": severity,
-                    "detail": issue.get("recommendation", ""),
-                })
-
-        # Session end event
-        if end_time:
-            quality = session.get("overall_quality", "GOOD")
-            severity = "info" if quality in ("EXCELLENT", "GOOD") else ("warning" if quality == "POOR" else "critical")
-            events.append({
-                "id": f"{sid}-end",
-                "timestamp": end_time,
-                "event_type": "session_end",
-                "session_id": sid,
-                "agent_name": agent,
-                "model": model,
-                "summary": f"Session ended – Quality: {quality}, Efficiency: {session.get('efficiency_score', 0)}%, Security: {session.get('security_score', 'N/A')}{'%' if session.get('security_score') is not None else ''}",
-                "severity": severity,
-            })
-
-    # Sort all events by timestamp descending (timezone-aware)
-    _local_tz = datetime.now(timezone.utc).astimezone().tzinfo
-
-    def _parse_ts(ts_str: str) -> datetime:
-        """Parse ISO timestamp; assume local timezone if no tz info."""
-        try:
-            dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=_local_tz)
-            return dt
-        except (ValueError, TypeError):
-            return datetime.min.replace(tzinfo=timezone.utc)
-
-    events.sort(key=lambda e: _parse_ts(e.get("timestamp", "")), reverse=True)
-
-    # Apply event-level filters
-    if event_type or severity_filter:
-        events = [
-            e for e in events
-            if (not event_type or e["event_type"] == event_type)
-            and (not severity_filter or e["severity"] == severity_filter)
-        ]
+        # Apply event-level filters
+        if event_type or severity_filter:
+            keyed.extend(
+                item for item in session_events
+                if (not event_type or item[1]["event_type"] == event_type)
+                and (not severity_filter or item[1]["severity"] == severity_filter)
+            )
+        else:
+            keyed.extend(session_events)
 
-    return events[:limit]
+    # Newest first (timezone-aware); nlargest matches sorted(reverse=True)[:limit]
+    return _json_response([e for _, e in heapq.nlargest(limit, keyed, key=lambda item: item[0])])
 
 
 @router.delete("/api/audit-logs/{event_id}", dependencies=[Depends(verify_api_key)])
@@ -180,7 +286,7 @@ def delete_audit_event(
     # Session-level events: delete the whole file
     if event_type in ("session_start", "session_end"):
         try:
-            session_file.unlink()
+            _remove_session_files(session_file)
             return {"status": "deleted", "event_id": event_id, "action": "session_deleted"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -188,15 +294,15 @@ def delete_audit_event(
     # Step-level event: remove step from session
     if event_type == "tool_call":
         try:
-            with open(session_file) as f:
-                session = json.load(f)
-            steps = session.get("steps", [])
-            new_steps = [s for s in steps if s.get("step_id") != event_id]
-            if len(new_steps) == len(steps):
-                raise HTTPException(status_code=404, detail="Step not found")
-            session["steps"] = new_steps
-            session["total_steps"] = len(new_steps)
-            _atomic_write_json(session_file, session)
+            with _get_session_lock(session_id):
+                session = _load_session(session_file)
+                steps = session.get("steps", [])
+                new_steps = [s for s in steps if s.get("step_id") != event_id]
+                if len(new_steps) == len(steps):
+                    raise HTTPException(status_code=404, detail="Step not found")
+                session["steps"] = new_steps
+                session["total_steps"] = len(new_steps)
+                _save_session(session_id, session_file, session)
             return {"status": "deleted", "event_id": event_id, "action": "step_deleted"}
         except HTTPException:
             raise
@@ -206,14 +312,14 @@ def delete_audit_event(
     # Issue-level event: remove issue from session
     if event_type == "issue":
         try:
-            with open(session_file) as f:
-                session = json.load(f)
-            issues = session.get("issues", [])
-            new_issues = [i for i in issues if not (isinstance(i, dict) and i.get("issue_id") == event_id)]
-            if len(new_issues) == len(issues):
-                raise HTTPException(status_code=404, detail="Issue not found")
-            session["issues"] = new_issues
-            _atomic_write_json(session_file, session)
+            with _get_session_lock(session_id):
+                session = _load_session(session_file)
+                issues = session.get("issues", [])
+                new_issues = [i for i in issues if not (isinstance(i, dict) and i.get("issue_id") == event_id)]
+                if len(new_issues) == len(issues):
+                    raise HTTPException(status_code=404, detail="Issue not found")
+                session["issues"] = new_issues
+                _save_session(session_id, session_file, session)
             return {"status": "deleted", "event_id": event_id, "action": "issue_deleted"}
         except HTTPException:
             raise
@@ -231,7 +337,7 @@ def delete_all_audit_logs() -> Dict[str, Any]:
     deleted = 0
     for f in SESSIONS_DIR.glob("*.json"):
         try:
-            f.unlink()
+            _remove_session_files(f)
             deleted += 1
         except OSError as e:
             logger.warning(f"Failed to delete {f}: {e}")
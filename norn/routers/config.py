@@ -2,7 +2,6 @@
 norn/routers/config.py — Norn configuration GET/PUT endpoints.
 """
 
-import json
 import logging
 from typing import Any, Dict
 
@@ -12,9 +11,10 @@ from norn.shared import (
     CONFIG_FILE,
     DEFAULT_CONFIG,
     LOGS_DIR,
-    REGISTRY_FILE,
     SESSIONS_DIR,
+    _count_files,
     _load_config,
+    _read_registry,
     _save_config,
     verify_api_key,
 )
@@ -29,26 +29,17 @@ def get_config() -> Dict[str, Any]:
     config = _load_config()
 
     # Add runtime info
-    sessions_count = len(list(SESSIONS_DIR.glob("*.json"))) if SESSIONS_DIR.exists() else 0
-    agents_count = 0
-    if REGISTRY_FILE.exists():
-        try:
-            with open(REGISTRY_FILE) as f:
-                agents_count = len(json.load(f))
-        except Exception:
-            pass
-
-    steps_files = list((LOGS_DIR / "steps").glob("*.jsonl")) if (LOGS_DIR / "steps").exists() else []
-    issues_files = list((LOGS_DIR / "issues").glob("*.json")) if (LOGS_DIR / "issues").exists() else []
+    # Registry reads are served from the stat-validated cache in norn.shared
+    agents_count = len(_read_registry())
 
     config["_runtime"] = {
         "api_version": "1.0.0",
         "log_directory": str(LOGS_DIR.resolve()),
         "sessions_directory": str(SESSIONS_DIR.resolve()),
-        "total_session_files": sessions_count,
+        "total_session_files": _count_files(SESSIONS_DIR, ".json"),
         "total_agent_files": agents_count,
-        "total_step_log_files": len(steps_files),
-        "total_issue_files": len(issues_files),
+        "total_step_log_files": _count_files(LOGS_DIR / "steps", ".jsonl"),
+        "total_issue_files": _count_files(LOGS_DIR / "issues", ".json"),
         "config_file": str(CONFIG_FILE.resolve()),
         "config_exists": CONFIG_FILE.exists(),
     }
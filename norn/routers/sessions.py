@@ -4,18 +4,34 @@ norn/routers/sessions.py — Session CRUD routes + normalize_session helper.
 normalize_session() is exported for use by websocket.py and stats.py.
 """
 
-import json
+import asyncio
+import functools
 import logging
+import os
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
 
 from norn.shared import (
     SESSIONS_DIR,
+    _STEP_HANDLES_MAX,
+    _SessionSig,
+    _append_session_step,
     _atomic_write_json,
+    _discard_session_steps,
     _get_session_lock,
+    _json_body,
+    _json_response,
+    _load_session,
+    _map_io,
+    _remove_session_files,
+    _scandir_sessions,
+    _session_sig,
+    _steps_path,
     manager,
     verify_api_key,
 )
@@ -26,163 +42,257 @@ logger = logging.getLogger("norn.api")
 
 # ── Normalize ────────────────────────────────────────────
 
+# Explicit statuses that override the one derived from quality/completion
+_EXPLICIT_STATUSES = frozenset(('active', 'queued', 'terminated'))
+
+# Active sessions older than this with no end time are reported as terminated
+_STALE_AFTER_SECONDS = 300
+# Queued sessions wait behind other runs, so they get a longer cutoff before a
+# run that never reached a worker (killed process, failed dispatch) is dropped
+_QUEUED_STALE_AFTER_SECONDS = 3600
+
+
+@functools.lru_cache(maxsize=4096)
+def _start_epoch(started_at: str) -> Optional[float]:
+    """UNIX time of an ISO start timestamp (naive = local time), None if unparseable.
+    Cached: active sessions are re-normalized with the same start time on every poll."""
+    if started_at.endswith('Z'):
+        started_at = started_at[:-1] + '+00:00'
+    try:
+        start_dt = datetime.fromisoformat(started_at)
+    except ValueError:
+        return None
+    try:
+        return start_dt.timestamp()
+    except (OverflowError, OSError, ValueError):
+        return float('-inf')  # before the platform's epoch range — long stale
+
+
+def _fmt_kv(item: Tuple[str, Any]) -> str:
+    """One "key=repr(value)" fragment of a step's tool input."""
+    return f'{item[0]}={item[1]!r}'
+
+
+def _normalize_step(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize one step for the session timeline."""
+    g = step.get
+
+    # Format tool input as readable string
+    tool_input = g('tool_input', {})
+    if isinstance(tool_input, dict):
+        input_str = ', '.join(map(_fmt_kv, tool_input.items()))
+    else:
+        input_str = str(tool_input)
+
+    # Truncate long results for display
+    tool_result = g('tool_result', '')
+    if not isinstance(tool_result, str):
+        tool_result = str(tool_result)
+    if len(tool_result) > 300:
+        tool_result = tool_result[:300] + '...'
+
+    return {
+        'step_id': g('step_id', ''),
+        'step_number': g('step_number', 0),
+        'timestamp': g('timestamp', ''),
+        'tool_name': g('tool_name', '') or g('action', ''),
+        'tool_input': input_str,
+        'tool_result': tool_result,
+        'status': g('status', 'SUCCESS'),
+        'relevance_score': g('relevance_score'),
+        'security_score': g('security_score'),
+        'reasoning': g('reasoning', ''),
+        'metadata': g('metadata', {}),
+    }
+
+
+def _normalize_issue(issue: Any) -> Dict[str, Any]:
+    """Normalize one issue - keep the full object for the frontend detail view."""
+    if isinstance(issue, dict):
+        g = issue.get
+        return {
+            'issue_id': g('issue_id', ''),
+            'issue_type': g('issue_type', 'NONE'),
+            'severity': g('severity', 5),
+            'description': g('description', ''),
+            'recommendation': g('recommendation', ''),
+            'affected_steps': g('affected_steps', []),
+        }
+    return {
+        'issue_type': str(issue),
+        'severity': 5,
+        'description': str(issue),
+        'recommendation': '',
+    }
+
+
 def normalize_session(session: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize session data for consistent frontend consumption"""
+    g = session.get
+
     # Ensure task is a string for taskPreview
-    task = session.get('task', '')
-    if isinstance(task, dict):
-        task_str = task.get('description', '')
-    else:
-        task_str = str(task)
-
-    # Normalize issues - keep full objects for frontend detail view
-    issues = session.get('issues', [])
-    normalized_issues = []
-    for issue in issues:
-        if isinstance(issue, dict):
-            normalized_issues.append({
-                'issue_id': issue.get('issue_id', ''),
-                'issue_type': issue.get('issue_type', 'NONE'),
-                'severity': issue.get('severity', 5),
-                'description': issue.get('description', ''),
-                'recommendation': issue.get('recommendation', ''),
-                'affected_steps': issue.get('affected_steps', []),
-            })
-        else:
-            normalized_issues.append({
-                'issue_type': str(issue),
-                'severity': 5,
-                'description': str(issue),
-                'recommendation': '',
-            })
+    task = g('task', '')
+    task_str = task.get('description', '') if isinstance(task, dict) else str(task)
 
-    # Normalize steps - include full data for timeline rendering
-    steps = session.get('steps', [])
-    normalized_steps = []
-    for step in steps:
-        # Format tool input as readable string
-        tool_input = step.get('tool_input', {})
-        if isinstance(tool_input, dict):
-            input_parts = [f'{k}={repr(v)}' for k, v in tool_input.items()]
-            input_str = ', '.join(input_parts)
-        else:
-            input_str = str(tool_input)
-
-        tool_name = step.get('tool_name', '') or step.get('action', '')
-        tool_result = step.get('tool_result', '')
-
-        # Truncate long results for display
-        if len(str(tool_result)) > 300:
-            tool_result = str(tool_result)[:300] + '...'
-
-        normalized_steps.append({
-            'step_id': step.get('step_id', ''),
-            'step_number': step.get('step_number', 0),
-            'timestamp': step.get('timestamp', ''),
-            'tool_name': tool_name,
-            'tool_input': input_str,
-            'tool_result': str(tool_result),
-            'status': step.get('status', 'SUCCESS'),
-            'relevance_score': step.get('relevance_score'),
-            'security_score': step.get('security_score'),
-            'reasoning': step.get('reasoning', ''),
-            'metadata': step.get('metadata', {}),
-        })
+    started_at = g('started_at') or g('start_time')
+    ended_at = g('ended_at')
+    end_time = ended_at or g('end_time')
 
     # Derive session status from quality and completion
-    overall_quality = session.get('overall_quality', 'GOOD')
-    if session.get('loop_detected') or overall_quality == 'STUCK':
+    overall_quality = g('overall_quality', 'GOOD')
+    if g('loop_detected') or overall_quality == 'STUCK':
         status = 'terminated'
-    elif session.get('ended_at') or session.get('end_time'):
+    elif end_time:
         status = 'completed'
     else:
         status = 'active'
 
     # Override with explicit status if present
-    explicit_status = session.get('status')
-    if explicit_status and explicit_status in ('active', 'terminated'):
+    explicit_status = g('status')
+    if isinstance(explicit_status, str) and explicit_status in _EXPLICIT_STATUSES:
         status = explicit_status
 
     # Stale session detection: mark active sessions as terminated
     # if they started more than 5 minutes ago with no end time
-    if status == 'active':
-        started_at = session.get('started_at') or session.get('start_time')
-        if started_at:
-            try:
-                start_dt = datetime.fromisoformat(str(started_at).replace('Z', '+00:00'))
-                now = datetime.now(start_dt.tzinfo) if start_dt.tzinfo else datetime.now()
-                elapsed_minutes = (now - start_dt).total_seconds() / 60
-                if elapsed_minutes > 5 and not session.get('ended_at'):
-                    status = 'terminated'
-                    overall_quality = 'FAILED'
-            except (ValueError, TypeError):
-                pass
+    if status == 'active' and started_at and not ended_at:
+        start_epoch = _start_epoch(str(started_at))
+        if start_epoch is not None and time.time() - start_epoch > _STALE_AFTER_SECONDS:
+            status = 'terminated'
+            overall_quality = 'FAILED'
+    elif status == 'queued':
+        queued_at = g('queued_at') or started_at
+        start_epoch = _start_epoch(str(queued_at)) if queued_at else None
+        if start_epoch is not None and time.time() - start_epoch > _QUEUED_STALE_AFTER_SECONDS:
+            status = 'terminated'
+            overall_quality = 'FAILED'
 
     return {
-        'session_id': session.get('session_id', ''),
-        'agent_name': session.get('agent_name', 'Unknown'),
-        'model': session.get('model'),
+        'session_id': g('session_id', ''),
+        'agent_name': g('agent_name', 'Unknown'),
+        'model': g('model'),
         'task': task_str,
-        'start_time': session.get('started_at') or session.get('start_time', ''),
-        'end_time': session.get('ended_at') or session.get('end_time'),
+        'start_time': started_at or g('start_time', ''),
+        'end_time': end_time,
         'status': status,
-        'total_steps': session.get('total_steps', 0),
+        'total_steps': g('total_steps', 0),
         'overall_quality': overall_quality,
-        'efficiency_score': session.get('efficiency_score'),
-        'security_score': session.get('security_score'),
-        'issues': normalized_issues,
-        'steps': normalized_steps,
-        'ai_evaluation': session.get('ai_evaluation'),
-        'tool_analysis': session.get('tool_analysis', []),
-        'decision_observations': session.get('decision_observations', []),
-        'efficiency_explanation': session.get('efficiency_explanation', ''),
-        'recommendations': session.get('recommendations', []),
-        'task_completion': session.get('task_completion', False),
-        'loop_detected': session.get('loop_detected', False),
-        'security_breach_detected': session.get('security_breach_detected', False),
-        'total_execution_time_ms': session.get('total_execution_time_ms', 0),
+        'efficiency_score': g('efficiency_score'),
+        'security_score': g('security_score'),
+        'issues': [_normalize_issue(issue) for issue in g('issues', [])],
+        'steps': [_normalize_step(step) for step in g('steps', [])],
+        'ai_evaluation': g('ai_evaluation'),
+        'tool_analysis': g('tool_analysis', []),
+        'decision_observations': g('decision_observations', []),
+        'efficiency_explanation': g('efficiency_explanation', ''),
+        'recommendations': g('recommendations', []),
+        'task_completion': g('task_completion', False),
+        'loop_detected': g('loop_detected', False),
+        'security_breach_detected': g('security_breach_detected', False),
+        'total_execution_time_ms': g('total_execution_time_ms', 0),
     }
 
 
-# ── Routes ───────────────────────────────────────────────
+# ── Normalized session cache ─────────────────────────────
+# path -> (session signature, normalized session). Validated by stat on every
+# read, because the runner, AuditLogger and other processes also write sessions.
+# Cached dicts are shared between requests and must not be mutated.
+_SESSION_CACHE: Dict[str, Tuple[_SessionSig, Dict[str, Any]]] = {}
+_SESSION_CACHE_MAX = 4096
+
+# path -> (session signature, _json_body(normalized session)) for GET
+# /api/sessions/{id}; same validation and eligibility as _SESSION_CACHE.
+_SESSION_BODIES: Dict[str, Tuple[_SessionSig, bytes]] = {}
+
+# session_id -> step count as of the last append by this process; re-read from
+# disk whenever a new sidecar is started (i.e. after every fold). Least recently
+# appended first, bounded like the sidecar handles — an evicted count is simply
+# re-read on the session's next append.
+_STEP_COUNTS: Dict[str, int] = {}
+_STEP_COUNTS_MAX = _STEP_HANDLES_MAX
+_step_counts_lock = threading.Lock()
+
+
+def _load_normalized(path: str, sig: _SessionSig) -> Dict[str, Any]:
+    """normalize_session() of the session at path, reusing the cached result while
+    its signature is unchanged."""
+    cached = _SESSION_CACHE.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    normalized = normalize_session(_load_session(path))
+    _cache_normalized(path, sig, normalized)
+    return normalized
+
+
+def _cache_normalized(path: str, sig: _SessionSig, normalized: Dict[str, Any]) -> None:
+    # An 'active' status depends on the clock (stale detection) — only cache settled ones
+    if normalized["status"] != "active":
+        if len(_SESSION_CACHE) >= _SESSION_CACHE_MAX:
+            _SESSION_CACHE.clear()
+        _SESSION_CACHE[path] = (sig, normalized)
+
+
+def _session_body(path: str, sig: _SessionSig) -> bytes:
+    """Serialized _load_normalized(path, sig), cached for settled sessions."""
+    cached = _SESSION_BODIES.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    normalized = _load_normalized(path, sig)
+    body = _json_body(normalized)
+    if normalized["status"] != "active":
+        if len(_SESSION_BODIES) >= _SESSION_CACHE_MAX:
+            _SESSION_BODIES.clear()
+        _SESSION_BODIES[path] = (sig, body)
+    return body
+
+
+def _invalidate_session(session_file) -> None:
+    _SESSION_CACHE.pop(str(session_file), None)
+    _SESSION_BODIES.pop(str(session_file), None)
+
+
+def _save_session(session_id: str, session_file, session: Dict[str, Any]) -> _SessionSig:
+    """Write a full session (loaded with _load_session) and fold away its sidecar.
+    Call with the session lock held. Returns the signature of the written session."""
+    st = _atomic_write_json(session_file, session)
+    _discard_session_steps(session_file)
+    _STEP_COUNTS.pop(session_id, None)
+    _invalidate_session(session_file)
+    return st.st_mtime_ns, st.st_size, 0, 0
 
-@router.get("/api/sessions", dependencies=[Depends(verify_api_key)])
-def get_sessions(limit: int = 50) -> List[Dict[str, Any]]:
-    """Get all monitoring sessions"""
-    if not SESSIONS_DIR.exists():
-        return []
-
-    sessions = []
-    session_files = sorted(
-        SESSIONS_DIR.glob("*.json"),
-        key=lambda f: f.stat().st_mtime,
-        reverse=True
-    )
 
-    for file in session_files[:limit]:
+# ── Routes ───────────────────────────────────────────────
+
+def _list_sessions(limit: int = 50) -> List[Dict[str, Any]]:
+    """The most recently active normalized sessions, newest first."""
+    def _load(item: Tuple[str, _SessionSig]) -> Optional[Dict[str, Any]]:
+        file, sig = item
         try:
-            with open(file) as f:
-                session = json.load(f)
-                normalized = normalize_session(session)
-                sessions.append(normalized)
+            return _load_normalized(file, sig)
         except Exception as e:
             logger.warning(f"Error loading session {file}: {e}")
+            return None
 
-    return sessions
+    return [s for s in _map_io(_load, _scandir_sessions()[:limit]) if s is not None]
+
+
+@router.get("/api/sessions", dependencies=[Depends(verify_api_key)])
+def get_sessions(limit: int = 50) -> Response:
+    """Get all monitoring sessions"""
+    return _json_response(_list_sessions(limit))
 
 
 @router.get("/api/sessions/{session_id}", dependencies=[Depends(verify_api_key)])
-def get_session(session_id: str) -> Dict[str, Any]:
+def get_session(session_id: str) -> Response:
     """Get specific session details"""
     session_file = SESSIONS_DIR / f"{session_id}.json"
 
-    if not session_file.exists():
+    try:
+        sig = _session_sig(session_file)
+    except OSError:
         raise HTTPException(status_code=404, detail="Session not found")
 
     try:
-        with open(session_file) as f:
-            session = json.load(f)
-            return normalize_session(session)
+        return _json_response(body=_session_body(str(session_file), sig))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -201,8 +311,7 @@ def ingest_session(data: Dict[str, Any]) -> Dict[str, Any]:
     if session_file.exists():
         try:
             with _get_session_lock(session_id):
-                with open(session_file) as f:
-                    existing = json.load(f)
+                existing = _load_session(session_file)
                 existing["status"] = "active"
                 existing["ended_at"] = None
                 if data.get("task") and not existing.get("task"):
@@ -212,7 +321,7 @@ def ingest_session(data: Dict[str, Any]) -> Dict[str, Any]:
                     existing["swarm_id"] = data["swarm_id"]
                 if data.get("swarm_order") is not None and existing.get("swarm_order") is None:
                     existing["swarm_order"] = data["swarm_order"]
-                _atomic_write_json(session_file, existing)
+                _save_session(session_id, session_file, existing)
             logger.info("Session resumed: %s (%d existing steps)", session_id, len(existing.get("steps", [])))
             return existing
         except Exception as e:
@@ -255,6 +364,34 @@ def ingest_session(data: Dict[str, Any]) -> Dict[str, Any]:
     return session_data
 
 
+def _append_step(session_id: str, session_file, data: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """Blocking part of add_session_step: returns (total_steps, normalized session
+    when this was the first step, else None)."""
+    with _get_session_lock(session_id):
+        with _step_counts_lock:
+            total_steps = _STEP_COUNTS.pop(session_id, None)
+        if total_steps is None or not os.path.exists(_steps_path(session_file)):
+            # First append since the last fold: sync the count, reactivate once
+            session = _load_session(session_file)
+            total_steps = len(session.get("steps") or [])
+            if session.get("status") != "active":
+                session["status"] = "active"
+                _save_session(session_id, session_file, session)
+
+        # O(step) append instead of rewriting the whole session file
+        _append_session_step(session_file, data)
+        total_steps += 1
+        with _step_counts_lock:
+            if len(_STEP_COUNTS) >= _STEP_COUNTS_MAX:
+                _STEP_COUNTS.pop(next(iter(_STEP_COUNTS)))
+            _STEP_COUNTS[session_id] = total_steps
+        _invalidate_session(session_file)
+
+    if total_steps == 1:
+        return total_steps, normalize_session(_load_session(session_file))
+    return total_steps, None
+
+
 @router.post("/api/sessions/{session_id}/step")
 async def add_session_step(session_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Add a step to a session in real-time."""
@@ -263,30 +400,78 @@ async def add_session_step(session_id: str, data: Dict[str, Any]) -> Dict[str, A
         raise HTTPException(status_code=404, detail="Session not found")
 
     try:
-        with _get_session_lock(session_id):
-            with open(session_file) as f:
-                session = json.load(f)
-
-            session.setdefault("steps", []).append(data)
-            session["total_steps"] = len(session["steps"])
-            session["status"] = "active"
-
-            _atomic_write_json(session_file, session)
+        # File I/O and the session lock stay off the event loop
+        total_steps, full_session = await asyncio.to_thread(_append_step, session_id, session_file, data)
 
-        # Broadcast to WebSocket clients (outside lock to avoid holding it)
+        # Broadcast to WebSocket clients (outside lock to avoid holding it). After the
+        # first step only the new step is sent — clients append it, so a long session
+        # isn't re-normalized and re-sent in full on every step.
         try:
-            await manager.broadcast({
-                "type": "session_update",
-                "session": normalize_session(session),
-            })
+            if full_session is not None:
+                await manager.broadcast({
+                    "type": "session_update",
+                    "session": full_session,
+                })
+            else:
+                await manager.broadcast({
+                    "type": "session_step_append",
+                    "session_id": session_id,
+                    "total_steps": total_steps,
+                    "step": _normalize_step(data),
+                })
         except Exception:
             pass
 
-        return {"status": "ok", "total_steps": session["total_steps"]}
+        return {"status": "ok", "total_steps": total_steps}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _complete(session_id: str, session_file, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Blocking part of complete_session: merge and save the session, then return
+    it normalized (also seeding the cache for the dashboard's next GET)."""
+    with _get_session_lock(session_id):
+        session = _load_session(session_file)
+
+        existing_steps = session.get("steps", [])
+        incoming_steps = data.pop("steps", None)
+        session.update(data)
+
+        if incoming_steps:
+            # Merge incoming steps with existing: non-null incoming values
+            # overwrite existing values (e.g. AI eval scores replacing nulls).
+            existing_by_id: Dict[str, int] = {}
+            for idx, s in enumerate(existing_steps):
+                sid = s.get("step_id")
+                if sid:
+                    existing_by_id[sid] = idx
+
+            merged = [dict(s) for s in existing_steps]
+            for s in incoming_steps:
+                sid = s.get("step_id")
+                if sid and sid in existing_by_id:
+                    tgt = merged[existing_by_id[sid]]
+                    for k, v in s.items():
+                        if v is not None and v != "" and v != []:
+                            tgt[k] = v
+                elif sid:
+                    merged.append(s)
+
+            session["steps"] = merged
+            session["total_steps"] = len(merged)
+        else:
+            session["steps"] = existing_steps
+            session["total_steps"] = len(existing_steps)
+
+        session["status"] = data.get("status", "completed")
+
+        sig = _save_session(session_id, session_file, session)
+
+    normalized = normalize_session(session)
+    _cache_normalized(str(session_file), sig, normalized)
+    return normalized
+
+
 @router.post("/api/sessions/{session_id}/complete")
 async def complete_session(session_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Mark session as complete and update scores. Preserves existing steps."""
@@ -295,48 +480,12 @@ async def complete_session(session_id: str, data: Dict[str, Any]) -> Dict[str, A
         raise HTTPException(status_code=404, detail="Session not found")
 
     try:
-        with _get_session_lock(session_id):
-            with open(session_file) as f:
-                session = json.load(f)
-
-            existing_steps = session.get("steps", [])
-            incoming_steps = data.pop("steps", None)
-            session.update(data)
-
-            if incoming_steps:
-                # Merge incoming steps with existing: non-null incoming values
-                # overwrite existing values (e.g. AI eval scores replacing nulls).
-                existing_by_id: Dict[str, int] = {}
-                for idx, s in enumerate(existing_steps):
-                    sid = s.get("step_id")
-                    if sid:
-                        existing_by_id[sid] = idx
-
-                merged = [dict(s) for s in existing_steps]
-                for s in incoming_steps:
-                    sid = s.get("step_id")
-                    if sid and sid in existing_by_id:
-                        tgt = merged[existing_by_id[sid]]
-                        for k, v in s.items():
-                            if v is not None and v != "" and v != []:
-                                tgt[k] = v
-                    elif sid:
-                        merged.append(s)
-
-                session["steps"] = merged
-                session["total_steps"] = len(merged)
-            else:
-                session["steps"] = existing_steps
-                session["total_steps"] = len(existing_steps)
-
-            session["status"] = data.get("status", "completed")
-
-            _atomic_write_json(session_file, session)
+        normalized = await asyncio.to_thread(_complete, session_id, session_file, data)
 
         try:
             await manager.broadcast({
                 "type": "session_update",
-                "session": normalize_session(session),
+                "session": normalized,
             })
         except Exception:
             pass
@@ -353,7 +502,9 @@ def delete_session(session_id: str) -> Dict[str, str]:
     if not session_file.exists():
         raise HTTPException(status_code=404, detail="Session not found")
     try:
-        session_file.unlink()
+        _remove_session_files(session_file)
+        _invalidate_session(session_file)
+        _STEP_COUNTS.pop(session_id, None)
         return {"status": "deleted", "id": session_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -367,8 +518,7 @@ def export_session_md(session_id: str) -> PlainTextResponse:
         raise HTTPException(status_code=404, detail="Session not found")
 
     try:
-        with open(session_file) as f:
-            raw = json.load(f)
+        raw = _load_session(session_file)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -528,15 +678,14 @@ def delete_step(session_id: str, step_id: str) -> Dict:
         raise HTTPException(status_code=404, detail="Session not found")
     try:
         with _get_session_lock(session_id):
-            with open(session_file) as f:
-                session = json.load(f)
+            session = _load_session(session_file)
             steps = session.get("steps", [])
             new_steps = [s for s in steps if s.get("step_id") != step_id]
             if len(new_steps) == len(steps):
                 raise HTTPException(status_code=404, detail="Step not found")
             session["steps"] = new_steps
             session["total_steps"] = len(new_steps)
-            _atomic_write_json(session_file, session)
+            _save_session(session_id, session_file, session)
         return {"ok": True, "remaining": len(new_steps)}
     except HTTPException:
         raise
@@ -7,7 +7,7 @@ from typing import Any, Dict
 from fastapi import APIRouter, Depends
 
 from norn.shared import verify_api_key
-from norn.routers.sessions import get_sessions
+from norn.routers.sessions import _list_sessions
 from norn.routers.agents_registry import get_agents
 
 router = APIRouter()
@@ -16,7 +16,7 @@ router = APIRouter()
 @router.get("/api/stats", dependencies=[Depends(verify_api_key)])
 def get_stats() -> Dict[str, Any]:
     """Get dashboard statistics"""
-    sessions = get_sessions()
+    sessions = _list_sessions()
     agents = get_agents()
 
     if not sessions:
@@ -29,11 +29,23 @@ def get_stats() -> Dict[str, Any]:
             "total_agents": len(agents)
         }
 
+    # One pass over the sessions for all aggregates
+    active = critical = 0
+    efficiency_total = security_total = 0
+    for s in sessions:
+        if s.get("status") == "active":
+            active += 1
+        security = s.get("security_score") or 100
+        if security < 70:
+            critical += 1
+        security_total += security
+        efficiency_total += s.get("efficiency_score") or 0
+
     return {
         "total_sessions": len(sessions),
-        "active_sessions": sum(1 for s in sessions if s.get("status") == "active"),
-        "critical_threats": sum(1 for s in sessions if (s.get("security_score") or 100) < 70),
-        "avg_efficiency": sum(s.get("efficiency_score") or 0 for s in sessions) / len(sessions),
-        "avg_security": sum(s.get("security_score") or 100 for s in sessions) / len(sessions),
+        "active_sessions": active,
+        "critical_threats": critical,
+        "avg_efficiency": efficiency_total / len(sessions),
+        "avg_security": security_total / len(sessions),
         "total_agents": len(agents)
     }
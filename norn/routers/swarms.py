@@ -2,38 +2,202 @@
 norn/routers/swarms.py — Swarm listing, detail, and AI analysis endpoints.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import PlainTextResponse
-
-from norn.shared import SESSIONS_DIR
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+
+from norn.shared import (
+    LOGS_DIR,
+    _SessionSig,
+    _atomic_write_json,
+    _json_body,
+    _json_line,
+    _json_loads,
+    _json_response,
+    _load_json,
+    _load_session,
+    _map_io,
+    _remove_session_files,
+    _scandir_sessions,
+)
 
 router = APIRouter()
 logger = logging.getLogger("norn.api")
 
-# Simple in-memory cache — analysis is deterministic for a completed swarm
-_analysis_cache: dict[str, dict] = {}
+# ── Analysis cache ───────────────────────────────────────
+# Analysis is deterministic for a completed swarm, so it is cached per swarm_id
+# together with a hash of the member sessions it was built from. Entries are
+# persisted under ANALYSIS_DIR so a restart does not repeat the LLM call; any
+# change to a member session changes the hash and forces a fresh analysis.
+ANALYSIS_DIR = LOGS_DIR / "analysis_cache"
+# swarm_id -> (content hash, payload), least recently used first
+_analysis_cache: dict[str, tuple[str, dict]] = {}
+_ANALYSIS_CACHE_MAX = 256
+_analysis_lock = threading.Lock()
+# (swarm_id, content hash) -> set once the analysis being computed for it is done;
+# concurrent requests for the same swarm wait on it instead of calling the LLM again
+_analysis_inflight: dict[tuple[str, str], threading.Event] = {}
+
+
+# ── Swarm index ──────────────────────────────────────────
+# path -> (session signature, swarm_id, started_at, ended_at, agent card).
+# Sessions outside any swarm are indexed too (swarm_id None, no card) so they are
+# not re-parsed on every listing. Entries are validated by stat and the index is
+# rebuilt from each directory listing, so it follows writes from any process.
+_SwarmEntry = tuple[_SessionSig, str | None, str, str, dict | None]
+# swarm_id -> member paths, rebuilt only when the index changes
+_SwarmGroups = dict[str, list[str]]
+# (index, groups) — swapped together so readers always see a matching pair
+_SWARM_STATE: tuple[dict[str, _SwarmEntry], _SwarmGroups] = ({}, {})
+
+# (groups, serialized /api/swarms body). The groups dict is replaced whenever any
+# session changes, so its identity doubles as the cache version.
+_list_cache: tuple[_SwarmGroups, bytes] | None = None
+
+# Swarm card quality, worst first
+_QUALITY_PRIORITY = ("FAILED", "STUCK", "POOR", "PENDING", "GOOD", "EXCELLENT")
+_QUALITY_RANK = {q: i for i, q in enumerate(_QUALITY_PRIORITY)}
+
+
+def _swarm_card(s: dict) -> dict:
+    """Per-agent summary shown on a swarm card."""
+    task = s.get("task")
+    return {
+        "session_id": s.get("session_id"),
+        "agent_name": s.get("agent_name"),
+        "swarm_order": s.get("swarm_order"),
+        "overall_quality": s.get("overall_quality", "PENDING"),
+        "efficiency_score": s.get("efficiency_score"),
+        "security_score": s.get("security_score"),
+        "task": task.get("description", "") if isinstance(task, dict) else (task or ""),
+        "status": s.get("status"),
+        "total_steps": s.get("total_steps", 0),
+        "handoff_input": s.get("handoff_input"),
+    }
+
+
+def _index_entry(item: tuple[str, _SessionSig]) -> tuple[str, _SwarmEntry | None]:
+    path, sig = item
+    try:
+        s = _load_session(path)
+    except Exception:
+        return path, None
+    swarm_id = s.get("swarm_id")
+    return path, (
+        sig,
+        swarm_id,
+        s.get("started_at") or "",
+        s.get("ended_at") or "",
+        _swarm_card(s) if swarm_id else None,
+    )
+
+
+def _refresh_swarm_index() -> tuple[dict[str, _SwarmEntry], _SwarmGroups]:
+    """Bring _SWARM_STATE in line with SESSIONS_DIR, parsing only changed files."""
+    global _SWARM_STATE
+    previous, groups = _SWARM_STATE
+    index: dict[str, _SwarmEntry] = {}
+    changed = []
+    for path, sig in _scandir_sessions():
+        cached = previous.get(path)
+        if cached is not None and cached[0] == sig:
+            index[path] = cached
+        else:
+            changed.append((path, sig))
+    for path, entry in _map_io(_index_entry, changed):
+        if entry is not None:
+            index[path] = entry
+    if changed or len(index) != len(previous):
+        groups = {}
+        for path, entry in index.items():
+            if entry[1]:
+                groups.setdefault(entry[1], []).append(path)
+    _SWARM_STATE = (index, groups)
+    return _SWARM_STATE
+
+
+def _members_hash(members: list[dict]) -> str:
+    return hashlib.blake2b(_json_body(members), digest_size=16).hexdigest()
+
+
+def _analysis_path(swarm_id: str) -> Path:
+    # swarm_id comes from the SDK, so it is hashed rather than used as a file name
+    return ANALYSIS_DIR / f"{hashlib.blake2b(swarm_id.encode(), digest_size=16).hexdigest()}.json"
+
+
+def _remember_analysis(swarm_id: str, entry: tuple[str, dict]) -> None:
+    with _analysis_lock:
+        _analysis_cache.pop(swarm_id, None)
+        if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+            _analysis_cache.pop(next(iter(_analysis_cache)))
+        _analysis_cache[swarm_id] = entry
+
+
+def _cached_analysis(swarm_id: str, content_hash: str) -> dict | None:
+    """Analysis for this exact swarm content — memory first, then disk."""
+    with _analysis_lock:
+        cached = _analysis_cache.pop(swarm_id, None)
+        if cached is not None:
+            _analysis_cache[swarm_id] = cached  # mark as most recently used
+    if cached is None:
+        try:
+            stored = _load_json(_analysis_path(swarm_id))
+            cached = (stored["hash"], stored["payload"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        _remember_analysis(swarm_id, cached)
+    return cached[1] if cached[0] == content_hash else None
+
+
+def _store_analysis(swarm_id: str, content_hash: str, payload: dict) -> None:
+    _remember_analysis(swarm_id, (content_hash, payload))
+    try:
+        ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(
+            _analysis_path(swarm_id),
+            {"swarm_id": swarm_id, "hash": content_hash, "payload": payload},
+        )
+    except OSError as e:
+        logger.warning("Could not persist swarm analysis for %s: %s", swarm_id, e)
+
+
+def _drop_analysis(swarm_id: str) -> None:
+    with _analysis_lock:
+        _analysis_cache.pop(swarm_id, None)
+    try:
+        os.unlink(_analysis_path(swarm_id))
+    except OSError:
+        pass
+
 
+def _load_swarm_members(swarm_id: str) -> list[dict]:
+    """Full session bodies of one swarm, sorted by swarm_order."""
+    paths = _refresh_swarm_index()[1].get(swarm_id, [])
 
-def _load_all_sessions() -> list[dict]:
-    """Load all session JSON files from SESSIONS_DIR."""
-    sessions = []
-    if not SESSIONS_DIR.exists():
-        return sessions
-    for f in SESSIONS_DIR.glob("*.json"):
+    def _load(path: str) -> dict | None:
         try:
-            with open(f) as fp:
-                sessions.append(json.load(fp))
+            return _load_session(path)
         except Exception:
-            pass
-    return sessions
+            return None
+
+    # Re-check swarm_id: a file may have been rewritten since it was indexed
+    members = [m for m in _map_io(_load, paths) if m is not None and m.get("swarm_id") == swarm_id]
+    members.sort(key=lambda s: s.get("swarm_order") or 0)
+    return members
 
 
 def _build_swarm_dialogue(sessions: list[dict]) -> str:
     """Build a readable pipeline summary for AI analysis."""
-    parts = []
+    # One line buffer for the whole swarm; agents are separated by a blank line
+    lines: list[str] = []
     for s in sessions:
         agent_name = s.get("agent_name") or f"Agent {s.get('swarm_order', '?')}"
         order = s.get("swarm_order", "?")
@@ -53,7 +217,9 @@ def _build_swarm_dialogue(sessions: list[dict]) -> str:
         quality = s.get("overall_quality", "")
         eff = s.get("efficiency_score")
 
-        lines = [f"[Agent {order}: {agent_name}]"]
+        if lines:
+            lines.append("")
+        lines.append(f"[Agent {order}: {agent_name}]")
         if handoff_in:
             preview = handoff_in[:300] + ("..." if len(handoff_in) > 300 else "")
             lines.append(f"  Received from previous agent: {preview}")
@@ -64,121 +230,117 @@ def _build_swarm_dialogue(sessions: list[dict]) -> str:
             lines.append(f"  Evaluation: {ai_eval}")
         lines.append(f"  Quality: {quality}" + (f", Efficiency: {eff}%" if eff is not None else ""))
 
-        parts.append("\n".join(lines))
+    return "\n".join(lines)
+
+
+def _swarm_summary(index: dict[str, _SwarmEntry], swarm_id: str, paths: list[str]) -> dict:
+    """One swarm card: earliest start, latest end and worst quality in one pass."""
+    cards = []
+    started_at = ended_at = None
+    rank = len(_QUALITY_PRIORITY)
+    for path in paths:
+        _, _, start, end, card = index[path]
+        cards.append(card)
+        if started_at is None or start < started_at:
+            started_at = start
+        if ended_at is None or end > ended_at:
+            ended_at = end
+        rank = min(rank, _QUALITY_RANK.get(card["overall_quality"], len(_QUALITY_PRIORITY)))
+    cards.sort(key=lambda c: c.get("swarm_order") or 0)
+    return {
+        "swarm_id": swarm_id,
+        "agent_count": len(cards),
+        # Overall swarm quality = worst individual quality
+        "overall_quality": _QUALITY_PRIORITY[rank] if rank < len(_QUALITY_PRIORITY) else "PENDING",
+        "started_at": started_at,
+        "ended_at": ended_at,
+        "agents": cards,
+    }
+
 
-    return "\n\n".join(parts)
+def _ordered_groups(
+    index: dict[str, _SwarmEntry], groups: _SwarmGroups,
+) -> list[tuple[str, list[str]]]:
+    """Swarm groups, most recently started first (by their earliest member start)."""
+    return sorted(
+        groups.items(),
+        key=lambda group: min(index[p][2] for p in group[1]) or "",
+        reverse=True,
+    )
 
 
 @router.get("/api/swarms")
-def list_swarms() -> list[dict]:
+def list_swarms() -> Response:
     """
     Return all swarm groups: sessions that share a swarm_id,
     summarised into one card per swarm.
     """
-    all_sessions = _load_all_sessions()
+    global _list_cache
+    index, groups = _refresh_swarm_index()
+    cached = _list_cache
+    if cached is not None and cached[0] is groups:
+        return _json_response(body=cached[1])
 
-    groups: dict[str, list[dict]] = {}
-    for s in all_sessions:
-        sid = s.get("swarm_id")
-        if sid:
-            groups.setdefault(sid, []).append(s)
+    body = _json_body([
+        _swarm_summary(index, swarm_id, paths)
+        for swarm_id, paths in _ordered_groups(index, groups)
+    ])
+    _list_cache = (groups, body)
+    return _json_response(body=body)
 
-    swarms = []
-    for swarm_id, members in groups.items():
-        sorted_members = sorted(members, key=lambda s: s.get("swarm_order") or 0)
 
-        quality_counts: dict[str, int] = {}
-        for m in members:
-            q = m.get("overall_quality", "PENDING")
-            quality_counts[q] = quality_counts.get(q, 0) + 1
+@router.get("/api/swarms/stream")
+def stream_swarms() -> StreamingResponse:
+    """list_swarms as NDJSON — one swarm card per line, built as it is sent."""
+    index, groups = _refresh_swarm_index()
 
-        # Overall swarm quality = worst individual quality
-        priority = ["FAILED", "STUCK", "POOR", "PENDING", "GOOD", "EXCELLENT"]
-        overall = "PENDING"
-        for q in priority:
-            if quality_counts.get(q):
-                overall = q
-                break
+    def _lines():
+        for swarm_id, paths in _ordered_groups(index, groups):
+            yield _json_line(_swarm_summary(index, swarm_id, paths))
 
-        swarms.append({
-            "swarm_id": swarm_id,
-            "agent_count": len(members),
-            "overall_quality": overall,
-            "started_at": min((m.get("started_at") or "") for m in members),
-            "ended_at": max((m.get("ended_at") or "") for m in members),
-            "agents": [
-                {
-                    "session_id": m.get("session_id"),
-                    "agent_name": m.get("agent_name"),
-                    "swarm_order": m.get("swarm_order"),
-                    "overall_quality": m.get("overall_quality", "PENDING"),
-                    "efficiency_score": m.get("efficiency_score"),
-                    "security_score": m.get("security_score"),
-                    "task": (m.get("task") or {}).get("description", "") if isinstance(m.get("task"), dict) else (m.get("task") or ""),
-                    "status": m.get("status"),
-                    "total_steps": m.get("total_steps", 0),
-                    "handoff_input": m.get("handoff_input"),
-                }
-                for m in sorted_members
-            ],
-        })
-
-    swarms.sort(key=lambda s: s.get("started_at") or "", reverse=True)
-    return swarms
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
 
 
 @router.delete("/api/swarms/{swarm_id}")
 def delete_swarm(swarm_id: str) -> dict:
     """Delete all session files belonging to a swarm and clear its analysis cache."""
     deleted = []
-    if SESSIONS_DIR.exists():
-        for f in SESSIONS_DIR.glob("*.json"):
-            try:
-                with open(f) as fp:
-                    data = json.load(fp)
-                if data.get("swarm_id") == swarm_id:
-                    f.unlink()
-                    deleted.append(f.name)
-            except Exception:
-                pass
+    for path in _refresh_swarm_index()[1].get(swarm_id, []):
+        try:
+            _remove_session_files(path)
+            deleted.append(os.path.basename(path))
+        except OSError:
+            pass
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Swarm not found")
 
-    _analysis_cache.pop(swarm_id, None)
+    _drop_analysis(swarm_id)
     logger.info("Deleted swarm %s (%d sessions)", swarm_id, len(deleted))
     return {"status": "deleted", "swarm_id": swarm_id, "deleted_sessions": len(deleted)}
 
 
 @router.get("/api/swarms/{swarm_id}")
-def get_swarm(swarm_id: str) -> dict:
+def get_swarm(swarm_id: str) -> Response:
     """Return full detail for a single swarm."""
-    all_sessions = _load_all_sessions()
-    members = [s for s in all_sessions if s.get("swarm_id") == swarm_id]
-    if not members:
+    sorted_members = _load_swarm_members(swarm_id)
+    if not sorted_members:
         raise HTTPException(status_code=404, detail="Swarm not found")
-
-    sorted_members = sorted(members, key=lambda s: s.get("swarm_order") or 0)
-    return {
+    return _json_response({
         "swarm_id": swarm_id,
-        "agent_count": len(members),
+        "agent_count": len(sorted_members),
         "sessions": sorted_members,
-    }
+    })
 
 
 @router.get("/api/swarms/{swarm_id}/export/md")
 def export_swarm_md(swarm_id: str) -> PlainTextResponse:
     """Export a full swarm pipeline report as a downloadable Markdown file."""
-    all_sessions = _load_all_sessions()
-    members = [s for s in all_sessions if s.get("swarm_id") == swarm_id]
-    if not members:
+    sorted_members = _load_swarm_members(swarm_id)
+    if not sorted_members:
         raise HTTPException(status_code=404, detail="Swarm not found")
 
-    sorted_members = sorted(members, key=lambda s: s.get("swarm_order") or 0)
-
-    analysis = None
-    if swarm_id in _analysis_cache:
-        analysis = _analysis_cache[swarm_id]
+    analysis = _cached_analysis(swarm_id, _members_hash(sorted_members))
 
     md = _build_swarm_markdown(swarm_id, sorted_members, analysis)
     filename = f"norn_swarm_{swarm_id[:20]}.md"
@@ -198,19 +360,19 @@ def _build_swarm_markdown(
     """Convert swarm sessions + analysis into a Markdown pipeline report."""
     from norn.routers.sessions import _build_session_markdown
 
-    priority = ["FAILED", "STUCK", "POOR", "PENDING", "GOOD", "EXCELLENT"]
-    quality_counts: dict[str, int] = {}
+    # Worst quality, earliest start and latest end in one pass
+    rank = len(_QUALITY_PRIORITY)
+    started = ended = None
     for m in members:
-        q = m.get("overall_quality", "PENDING")
-        quality_counts[q] = quality_counts.get(q, 0) + 1
-    overall = "PENDING"
-    for q in priority:
-        if quality_counts.get(q):
-            overall = q
-            break
-
-    started = min((m.get("started_at") or "") for m in members)
-    ended = max((m.get("ended_at") or "") for m in members)
+        quality = m.get("overall_quality", "PENDING")
+        rank = min(rank, _QUALITY_RANK.get(quality, len(_QUALITY_PRIORITY)))
+        start = m.get("started_at") or ""
+        end = m.get("ended_at") or ""
+        if started is None or start < started:
+            started = start
+        if ended is None or end > ended:
+            ended = end
+    overall = _QUALITY_PRIORITY[rank] if rank < len(_QUALITY_PRIORITY) else "PENDING"
 
     lines: list[str] = []
 
@@ -305,15 +467,13 @@ def get_swarm_analysis(swarm_id: str) -> dict:
     """
     Return a structured AI analysis of the swarm pipeline.
     Reads all agent sessions (tasks, evaluations, handoffs, steps) and asks
-    Nova Lite to assess inter-agent coherence.  Results are cached in memory.
+    Nova Lite to assess inter-agent coherence.  Results are cached in memory
+    and on disk, keyed by a hash of the member sessions.
     """
-    all_sessions = _load_all_sessions()
-    members = [s for s in all_sessions if s.get("swarm_id") == swarm_id]
-    if not members:
+    sorted_members = _load_swarm_members(swarm_id)
+    if not sorted_members:
         raise HTTPException(status_code=404, detail="Swarm not found")
 
-    sorted_members = sorted(members, key=lambda s: s.get("swarm_order") or 0)
-
     # Only use cache when ALL agents have completed — otherwise
     # early requests would cache incomplete results (e.g. only the first agent).
     all_completed = all(
@@ -321,11 +481,48 @@ def get_swarm_analysis(swarm_id: str) -> dict:
         for s in sorted_members
     )
 
-    if all_completed and swarm_id in _analysis_cache:
-        cached = _analysis_cache[swarm_id]
-        # Invalidate if agent count changed (new agent joined the swarm)
-        if cached.get("_agent_count") == len(sorted_members):
+    if not all_completed:
+        return _analyze_swarm(swarm_id, sorted_members)
+
+    content_hash = _members_hash(sorted_members)
+    key = (swarm_id, content_hash)
+    while True:
+        cached = _cached_analysis(swarm_id, content_hash)
+        if cached is not None:
             return cached
+        with _analysis_lock:
+            pending = _analysis_inflight.get(key)
+            if pending is None:
+                _analysis_inflight[key] = threading.Event()
+                break
+        # Another request is analysing this swarm — wait for it, then re-check the
+        # cache (if it failed, this request takes over)
+        pending.wait()
+
+    try:
+        payload = _analyze_swarm(swarm_id, sorted_members)
+        _store_analysis(swarm_id, content_hash, payload)
+        return payload
+    finally:
+        with _analysis_lock:
+            _analysis_inflight.pop(key).set()
+
+
+@functools.lru_cache(maxsize=1)
+def _analysis_model() -> Any:
+    """The BedrockModel used for swarm analysis, built once.
+
+    Construction resolves credentials and creates the boto3 client, so it is kept
+    across requests. The Agent is still created per call: agents accumulate
+    conversation history and must not be shared between concurrent requests.
+    """
+    from strands.models import BedrockModel
+
+    return BedrockModel(model_id="us.amazon.nova-2-lite-v1:0", temperature=0.3)
+
+
+def _analyze_swarm(swarm_id: str, sorted_members: list[dict]) -> dict:
+    """Ask Nova Lite for a structured assessment of the pipeline (uncached)."""
     dialogue = _build_swarm_dialogue(sorted_members)
 
     agent_names = [
@@ -335,11 +532,9 @@ def get_swarm_analysis(swarm_id: str) -> dict:
 
     try:
         from strands import Agent
-        from strands.models import BedrockModel
 
-        model = BedrockModel(model_id="us.amazon.nova-2-lite-v1:0", temperature=0.3)
         analyst = Agent(
-            model=model,
+            model=_analysis_model(),
             system_prompt=(
                 "You are an AI pipeline analyst. Assess multi-agent pipelines — "
                 "how well agents collaborate and build on each other's work. "
@@ -377,11 +572,12 @@ For each agent_assessment "note": describe what the agent did and how well it bu
             response_text = "\n".join(lines[1:-1])
 
         try:
-            result = json.loads(response_text)
+            result = _json_loads(response_text)
         except json.JSONDecodeError:
+            # Prose around the object — only now scan for its outer braces
             start = response_text.find("{")
             end = response_text.rfind("}") + 1
-            result = json.loads(response_text[start:end])
+            result = _json_loads(response_text[start:end])
 
         payload = {
             "swarm_id": swarm_id,
@@ -391,11 +587,6 @@ For each agent_assessment "note": describe what the agent did and how well it bu
             "pipeline_coherence": result.get("pipeline_coherence", ""),
             "recommendations": result.get("recommendations", []),
         }
-
-        # Only cache when all agents have completed — avoids stale partial results
-        if all_completed:
-            payload["_agent_count"] = len(sorted_members)
-            _analysis_cache[swarm_id] = payload
         return payload
 
     except Exception as e:
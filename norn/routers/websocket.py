@@ -8,13 +8,22 @@ notify_session_update() is exported for use by sessions.py async routes.
 
 import asyncio
 import logging
+import threading
 import time as _time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from norn.shared import API_KEY, manager
-from norn.routers.sessions import normalize_session
+from norn.shared import (
+    API_KEY,
+    _SessionSig,
+    _map_io,
+    _scandir_sessions,
+    _send_json,
+    _session_sig,
+    manager,
+)
+from norn.routers.sessions import _load_normalized
 from norn.routers.agents_registry import get_agents
 
 router = APIRouter()
@@ -23,23 +32,73 @@ logger = logging.getLogger("norn.api")
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _get_sessions_list():
-    """Return all normalized sessions for WebSocket payloads."""
-    from norn.shared import SESSIONS_DIR
-    import json
+# Every connected client refreshes on its own 5 s tick; clients that land within
+# _SESSIONS_LIST_TTL of each other share one list instead of each rescanning.
+_SESSIONS_LIST_TTL = 1.0
+_sessions_list_lock = threading.Lock()
+_sessions_list_memo: Tuple[float, List[Dict[str, Any]]] = (float("-inf"), [])
 
-    sessions = []
-    if not SESSIONS_DIR.exists():
+
+def _load_listed(item: Tuple[str, _SessionSig]) -> Optional[Dict[str, Any]]:
+    try:
+        return _load_normalized(*item)
+    except Exception:
+        return None
+
+
+def _get_sessions_list() -> List[Dict[str, Any]]:
+    """Return all normalized sessions for WebSocket payloads.
+
+    Unchanged settled sessions come from the stat-validated cache in
+    norn.routers.sessions, so a tick costs one scandir pass plus parses of
+    changed or active files. The returned list is shared and must not be mutated.
+    """
+    global _sessions_list_memo
+    with _sessions_list_lock:
+        built_at, sessions = _sessions_list_memo
+        if _time.monotonic() - built_at < _SESSIONS_LIST_TTL:
+            return sessions
+        sessions = [s for s in _map_io(_load_listed, _scandir_sessions()) if s is not None]
+        # Most recent first (mirrors GET /api/sessions)
+        sessions.sort(key=lambda s: s.get("started_at") or "", reverse=True)
+        _sessions_list_memo = (_time.monotonic(), sessions)
         return sessions
-    for f in SESSIONS_DIR.glob("*.json"):
-        try:
-            with open(f) as fp:
-                sessions.append(normalize_session(json.load(fp)))
-        except Exception:
-            pass
-    # Most recent first (mirrors GET /api/sessions)
-    sessions.sort(key=lambda s: s.get("started_at") or "", reverse=True)
-    return sessions
+
+
+def _snapshot(kind: str) -> Dict[str, Any]:
+    """Full sessions + agents payload (blocking — run it off the event loop)."""
+    return {"type": kind, "sessions": _get_sessions_list(), "agents": get_agents()}
+
+
+class _ClientView:
+    """What one connection was last sent, so each tick only ships changes."""
+
+    def __init__(self, snapshot: Dict[str, Any]):
+        self.sessions = {s.get("session_id"): s for s in snapshot["sessions"]}
+        self.agents = snapshot["agents"]
+
+    def diff(self) -> Optional[Dict[str, Any]]:
+        """A sessions_diff message for everything changed since the last call, or
+        None. Blocking — run it off the event loop."""
+        sessions = _get_sessions_list()
+        agents = get_agents()
+        sent = self.sessions
+        # Unchanged settled sessions are the very same cached dicts — `is` short-circuits
+        changed = [
+            s for s in sessions
+            if (prev := sent.get(s.get("session_id"))) is not s and prev != s
+        ]
+        current = {s.get("session_id"): s for s in sessions}
+        removed = [sid for sid in sent if sid not in current]
+        agents_changed = agents != self.agents
+        self.sessions = current
+        self.agents = agents
+        if not (changed or removed or agents_changed):
+            return None
+        message: Dict[str, Any] = {"type": "sessions_diff", "sessions": changed, "removed": removed}
+        if agents_changed:
+            message["agents"] = agents
+        return message
 
 
 # ── WebSocket endpoint ────────────────────────────────────────────────────────
@@ -61,11 +120,9 @@ async def websocket_sessions(websocket: WebSocket):
 
     try:
         # Send initial snapshot
-        await websocket.send_json({
-            "type": "initial",
-            "sessions": _get_sessions_list(),
-            "agents": get_agents(),
-        })
+        snapshot = await asyncio.to_thread(_snapshot, "initial")
+        await _send_json(websocket, snapshot)
+        view = _ClientView(snapshot)
 
         last_update = _time.time()
 
@@ -73,19 +130,17 @@ async def websocket_sessions(websocket: WebSocket):
             try:
                 data = await asyncio.wait_for(websocket.receive_text(), timeout=2.0)
                 if data == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await _send_json(websocket, {"type": "pong"})
             except asyncio.TimeoutError:
                 pass
 
-            # Periodic full refresh every 5 seconds
+            # Every 5 seconds send what changed since the last tick (nothing when idle)
             now = _time.time()
             if now - last_update >= 5.0:
                 last_update = now
-                await websocket.send_json({
-                    "type": "update",
-                    "sessions": _get_sessions_list(),
-                    "agents": get_agents(),
-                })
+                message = await asyncio.to_thread(view.diff)
+                if message is not None:
+                    await _send_json(websocket, message)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -96,19 +151,22 @@ async def websocket_sessions(websocket: WebSocket):
 
 # ── Broadcast helper ──────────────────────────────────────────────────────────
 
+def _load_current(path: str) -> Dict[str, Any]:
+    """Normalized session at path, from the signature-validated session cache."""
+    return _load_normalized(path, _session_sig(path))
+
+
 async def notify_session_update(session_id: str) -> None:
     """Push a single session update to all connected WebSocket clients."""
     try:
         from norn.shared import SESSIONS_DIR
-        import json
 
-        session_file = SESSIONS_DIR / f"{session_id}.json"
-        with open(session_file) as f:
-            session = json.load(f)
+        session_file = str(SESSIONS_DIR / f"{session_id}.json")
+        session = await asyncio.to_thread(_load_current, session_file)
 
         await manager.broadcast({
             "type": "session_update",
-            "session": normalize_session(session),
+            "session": session,
         })
     except Exception as exc:
         logger.warning(
@@ -6,14 +6,27 @@ All routers and execution modules import from here.
 """
 
 from fastapi import HTTPException, Request, WebSocket
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pathlib import Path
+import asyncio
+import contextlib
+import itertools
 import json
 import logging
+import mmap
 import os
+import queue
 import tempfile
 import threading
+import time
 import zipfile
-from typing import Any, Dict, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+
+try:
+    import orjson
+except ImportError:  # optional — installed with the [api] extra
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger("norn.api")
 
@@ -22,8 +35,57 @@ logger = logging.getLogger("norn.api")
 # process-global level so other threads' path resolution is not corrupted.
 _chdir_lock = threading.Lock()
 
-# _registry_lock: guards all read/write operations on agents_registry.json.
-_registry_lock = threading.Lock()
+
+class _RWLock:
+    """Reader-writer lock: any number of readers, or one writer.
+
+    Waiting writers block new readers so a steady stream of GETs can't starve
+    an import or status flip. Not reentrant — don't nest read() inside write().
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextlib.contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+# _registry_rlock / _registry_wlock: guard agents_registry.json. Plain reads take
+# the shared lock; every read-modify-write takes the exclusive one.
+_registry_rwlock = _RWLock()
+_registry_rlock = _registry_rwlock.read
+_registry_wlock = _registry_rwlock.write
 
 # _session_locks: per-session locks to prevent TOCTOU race conditions
 # during concurrent read-modify-write on session JSON files.
@@ -39,28 +101,134 @@ def _get_session_lock(session_id: str) -> threading.Lock:
         return _session_locks[session_id]
 
 
+# ── IDs ──────────────────────────────────────────────────
+# Start time in the high bits, PID below it, a per-process counter in the low 40
+# bits: unique across restarts and across workers sharing the same data dir, as
+# long as one process issues fewer than 2**40 ids (the counter would then carry
+# into the PID field).
+_ID_SEQ = itertools.count(
+    (int(time.time()) << 56) | ((os.getpid() & 0xFFFF) << 40)
+)
+
+
+def _fast_id(prefix: str) -> str:
+    """Return a process-unique id "<prefix>-<hex>" without a urandom syscall."""
+    return f"{prefix}-{next(_ID_SEQ):x}"
+
+
 # ── File Utilities ───────────────────────────────────────
 
-def _read_registry() -> list:
-    """Thread-safe registry read."""
-    with _registry_lock:
-        if not REGISTRY_FILE.exists():
-            return []
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes — orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_json(path: Path) -> Any:
+    """Read and parse a JSON file (raises OSError / ValueError like json.load).
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    `except json.JSONDecodeError` handlers keep working.
+    """
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+# App-wide default response class — orjson encodes far faster than json.dumps
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def _json_body(data: Any) -> bytes:
+    """Compact JSON response body for plain JSON data (dicts/lists/scalars)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def _json_response(data: Any = None, body: Optional[bytes] = None) -> Response:
+    """Response for plain JSON data, or for a body already built with _json_body().
+
+    Returning a Response skips FastAPI's jsonable_encoder walk and response-model
+    validation — use it for large payloads built from parsed session files.
+    """
+    if body is None:
+        body = _json_body(data)
+    return Response(content=body, media_type="application/json")
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode JSON with 2-space indentation, as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+# Parsed registry + {id: agent} index, keyed by the file's (st_mtime_ns, st_size).
+# Validated by stat on every read, because runner threads and other processes
+# also rewrite the file.
+_registry_cache: Optional[Tuple[int, int, list, Dict[str, dict]]] = None
+_registry_cache_lock = threading.Lock()
+
+
+def _read_registry_indexed() -> Tuple[list, Dict[str, dict]]:
+    """Thread-safe registry read returning (agents, {agent_id: agent}).
+
+    Uses the shared lock, so concurrent readers don't block each other. The list
+    is a fresh copy; the agent dicts (and the index) are shared with the cache
+    and must not be mutated.
+    """
+    with _registry_rlock():
         try:
-            with open(REGISTRY_FILE) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return []
+            st = REGISTRY_FILE.stat()
+        except OSError:
+            return [], {}
+        with _registry_cache_lock:
+            cached = _registry_cache
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return list(cached[2]), cached[3]
+        try:
+            agents = _load_json(REGISTRY_FILE)
+        except (ValueError, OSError):
+            return [], {}
+        return list(agents), _cache_registry(st, agents)
+
+
+def _cache_registry(st: os.stat_result, agents: list) -> Dict[str, dict]:
+    """Store agents as the parsed registry for file version st; returns the id index."""
+    global _registry_cache
+    # reversed() so the first entry wins on duplicate ids, like a linear scan
+    index = {a.get("id"): a for a in reversed(agents)}
+    with _registry_cache_lock:
+        _registry_cache = (st.st_mtime_ns, st.st_size, agents, index)
+    return index
+
+
+def _read_registry() -> list:
+    """Thread-safe registry read (see _read_registry_indexed)."""
+    return _read_registry_indexed()[0]
 
 
-def _atomic_write_json(path: Path, data: Any) -> None:
+def _invalidate_registry_cache() -> None:
+    global _registry_cache
+    with _registry_cache_lock:
+        _registry_cache = None
+
+
+def _atomic_write_json(path: Path, data: Any) -> os.stat_result:
     """Write JSON to a file atomically via a temp file + rename.
-    Prevents 0-byte files if the process is killed mid-write."""
+    Prevents 0-byte files if the process is killed mid-write.
+    Returns the stat of the written file (the rename keeps its mtime and size)."""
     tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
-        with os.fdopen(tmp_fd, "w") as f:
-            json.dump(data, f, indent=2)
+        with os.fdopen(tmp_fd, "wb") as f:
+            f.write(_json_dumps(data))
+            f.flush()
+            st = os.fstat(f.fileno())
         os.replace(tmp_path, path)
+        if path == REGISTRY_FILE:
+            _invalidate_registry_cache()
+        return st
     except Exception:
         try:
             os.unlink(tmp_path)
@@ -69,19 +237,326 @@ def _atomic_write_json(path: Path, data: Any) -> None:
         raise
 
 
+# (mutation, completion event, slot for the mutation's exception)
+_RegistryMutation = Tuple[Callable[[list], list], threading.Event, Dict[str, BaseException]]
+
+
+class _RegistryWriteCoalescer:
+    """Batches registry read-modify-writes from concurrent requests.
+
+    Callers hand mutate() a function list -> list; a single writer thread collects
+    everything queued within _WINDOW, applies the functions in arrival order to one
+    read of the registry, and persists the result with one atomic write. An
+    exception raised by a function is re-raised in its own caller only, so
+    functions should raise before touching the list, not after. Functions may set
+    top-level keys on entries in place, but must not mutate nested values.
+
+    mutate() blocks until the write lands — never call it while holding
+    _registry_wlock() (the writer thread needs that lock).
+    """
+
+    _WINDOW = 0.02  # seconds to wait for more mutations before writing
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[_RegistryMutation]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def mutate(self, fn: Callable[[list], list]) -> None:
+        done = threading.Event()
+        errors: Dict[str, BaseException] = {}
+        self._ensure_started()
+        self._queue.put((fn, done, errors))
+        done.wait()
+        if "error" in errors:
+            raise errors["error"]
+
+    def _ensure_started(self) -> None:
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._drain, name="norn-registry-writer", daemon=True,
+                )
+                self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            time.sleep(self._WINDOW)
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._apply(batch)
+            except Exception as e:
+                logger.warning(f"Registry write failed: {e}")
+                for _, _, errors in batch:
+                    errors.setdefault("error", e)
+            finally:
+                for _, done, _ in batch:
+                    done.set()
+
+    @staticmethod
+    def _load_current() -> list:
+        """Registry contents to mutate: the cached parse when the file hasn't changed
+        since it was cached (entries copied, so in-place edits don't leak into
+        readers' snapshots), otherwise a fresh read."""
+        try:
+            st = REGISTRY_FILE.stat()
+        except OSError:
+            return []
+        with _registry_cache_lock:
+            cached = _registry_cache
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return [dict(a) for a in cached[2]]
+        try:
+            return _load_json(REGISTRY_FILE)
+        except (OSError, ValueError):
+            return []
+
+    def _apply(self, batch: List[_RegistryMutation]) -> None:
+        with _registry_wlock():
+            agents = self._load_current()
+            changed = False
+            for fn, _, errors in batch:
+                try:
+                    agents = fn(agents)
+                    changed = True
+                except Exception as e:
+                    errors["error"] = e
+            if changed:
+                REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
+                st = _atomic_write_json(REGISTRY_FILE, agents)
+                # We just wrote it — seed the cache so the next read or batch skips a parse
+                _cache_registry(st, agents)
+
+
+_registry_writer = _RegistryWriteCoalescer()
+
+
 def _safe_extract(zip_ref: zipfile.ZipFile, extract_path: Path) -> None:
     """Extract ZIP safely — prevents path traversal attacks (../../etc/passwd style).
-    BUG-005 fix: validates every member path stays within extract_path."""
-    resolved_base = extract_path.resolve()
+    BUG-005 fix: validates every member path stays within extract_path.
+    Members are checked lexically (normpath, no per-member resolve()): the base
+    is resolved once, and zipfile never extracts symlinks, so ".." and absolute
+    names are the only way out."""
+    base = str(extract_path.resolve())
+    prefix = base + os.sep
     for member in zip_ref.namelist():
-        member_path = (extract_path / member).resolve()
-        if not str(member_path).startswith(str(resolved_base) + os.sep) and member_path != resolved_base:
+        member_path = os.path.normpath(os.path.join(base, member))
+        if member_path != base and not member_path.startswith(prefix):
             raise ValueError(f"ZIP path traversal attempt detected: {member}")
     zip_ref.extractall(extract_path)
 
 
+# ── Session Files ────────────────────────────────────────
+
+# Steps posted to /api/sessions/{id}/step are appended to a "<id>.steps.jsonl"
+# sidecar instead of rewriting the whole session JSON per step; any full rewrite
+# of the session through the API folds them back in. Read sessions through
+# _load_session() so sidecar steps are included.
+_STEPS_SUFFIX = ".steps.jsonl"
+
+# (st_mtime_ns, st_size) of a session JSON followed by those of its steps sidecar
+# (0, 0 when there is none) — changes whenever either file does.
+_SessionSig = Tuple[int, int, int, int]
+
+
+def _steps_path(session_file: Any) -> str:
+    """Sidecar path for a "<id>.json" session file."""
+    return os.fspath(session_file)[:-len(".json")] + _STEPS_SUFFIX
+
+
+def _session_sig(session_file: Any) -> _SessionSig:
+    """Stat signature of a session (raises OSError if the session JSON is missing)."""
+    st = os.stat(session_file)
+    try:
+        side = os.stat(_steps_path(session_file))
+        return st.st_mtime_ns, st.st_size, side.st_mtime_ns, side.st_size
+    except OSError:
+        return st.st_mtime_ns, st.st_size, 0, 0
+
+
+def _scandir_sessions(reverse: bool = True) -> List[Tuple[str, _SessionSig]]:
+    """(path, signature) for the session JSON files in SESSIONS_DIR, ordered by last
+    activity (newest first by default). One scandir pass, one stat per file."""
+    mains: List[Tuple[str, os.stat_result]] = []
+    sides: Dict[str, os.stat_result] = {}
+    try:
+        with os.scandir(SESSIONS_DIR) as it:
+            for e in it:
+                name = e.name
+                if name.endswith(".json"):
+                    target = None
+                elif name.endswith(_STEPS_SUFFIX):
+                    target = name[:-len(_STEPS_SUFFIX)] + ".json"
+                else:
+                    continue
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue  # deleted mid-scan
+                if target is None:
+                    mains.append((e.path, st))
+                else:
+                    sides[target] = st
+    except OSError:
+        return []
+    entries: List[Tuple[str, _SessionSig]] = []
+    for path, st in mains:
+        side = sides.get(os.path.basename(path))
+        if side is None:
+            entries.append((path, (st.st_mtime_ns, st.st_size, 0, 0)))
+        else:
+            entries.append((path, (st.st_mtime_ns, st.st_size, side.st_mtime_ns, side.st_size)))
+    entries.sort(key=lambda item: max(item[1][0], item[1][2]), reverse=reverse)
+    return entries
+
+
+def _json_line(data: Any) -> bytes:
+    """Encode one compact JSON line (newline-terminated)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, separators=(",", ":")).encode() + b"\n"
+
+
+# Session JSONs at least this large are parsed straight from a read-only mapping
+_MMAP_MIN_BYTES = 1 << 16
+
+
+def _read_session_json(session_file: Any) -> Dict[str, Any]:
+    """_load_json() for a session file, parsing large files from an mmap so the
+    contents are not first copied into a bytes object.
+
+    Safe because every writer replaces session files by rename — a mapped file is
+    never truncated underneath the parser.
+    """
+    if orjson is None:
+        return _load_json(session_file)
+    with open(session_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _load_session(
+    session_file: Any, load: Callable[[Any], Dict[str, Any]] = _read_session_json,
+) -> Dict[str, Any]:
+    """Read a session JSON (with load) plus any steps still in its sidecar.
+
+    Sidecar steps whose step_id is already in the session (e.g. merged in by
+    AuditLogger or a fold that hasn't removed the sidecar yet) are skipped.
+    """
+    session = load(session_file)
+    try:
+        with open(_steps_path(session_file), "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return session
+    extra = []
+    for line in lines:
+        try:
+            extra.append(_json_loads(line))
+        except ValueError:
+            continue  # torn final line from a concurrent append
+    if extra:
+        steps = list(session.get("steps") or [])
+        seen = {s.get("step_id") for s in steps if isinstance(s, dict) and s.get("step_id")}
+        steps.extend(s for s in extra if not (s.get("step_id") and s.get("step_id") in seen))
+        session["steps"] = steps
+        session["total_steps"] = len(steps)
+    return session
+
+
+# Open sidecar append handles, least recently used first. Unbuffered, so every
+# step is a single write() that readers see immediately.
+_STEP_HANDLES: Dict[str, Any] = {}
+_STEP_HANDLES_MAX = 256
+_step_handles_lock = threading.Lock()
+
+
+def _append_session_step(session_file: Any, step: Dict[str, Any]) -> None:
+    """Append one step to the session's sidecar, reusing an open handle."""
+    key = str(session_file)
+    line = _json_line(step)
+    with _step_handles_lock:
+        f = _STEP_HANDLES.pop(key, None)
+        if f is not None and os.fstat(f.fileno()).st_nlink == 0:
+            f.close()  # sidecar was removed behind our back (another process)
+            f = None
+        if f is None:
+            f = open(_steps_path(session_file), "ab", buffering=0)
+            if len(_STEP_HANDLES) >= _STEP_HANDLES_MAX:
+                _STEP_HANDLES.pop(next(iter(_STEP_HANDLES))).close()
+        _STEP_HANDLES[key] = f
+        f.write(line)
+
+
+def _close_step_handle(session_file: Any) -> None:
+    with _step_handles_lock:
+        f = _STEP_HANDLES.pop(str(session_file), None)
+    if f is not None:
+        f.close()
+
+
+def _discard_session_steps(session_file: Any) -> None:
+    """Remove the sidecar — call after its steps were written into the session JSON."""
+    _close_step_handle(session_file)
+    try:
+        os.unlink(_steps_path(session_file))
+    except FileNotFoundError:
+        pass
+
+
+def _remove_session_files(session_file: Any) -> None:
+    """Delete a session JSON and its sidecar (raises OSError like Path.unlink)."""
+    os.unlink(session_file)
+    _discard_session_steps(session_file)
+
+
+# Session files are read and parsed on this pool so one listing's file reads overlap
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4), thread_name_prefix="norn-io",
+)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _map_io(fn: Callable[[_T], _R], items: Iterable[_T]) -> List[_R]:
+    """list(map(fn, items)) with the calls spread over _IO_POOL, results in input order.
+    fn should handle its own errors — the first exception raised is re-raised here."""
+    items = list(items)
+    if len(items) < 2:
+        return [fn(item) for item in items]
+    return list(_IO_POOL.map(fn, items))
+
+
+def _count_files(directory: Any, suffix: str) -> int:
+    """Number of entries in directory ending with suffix (readdir only, no stat calls).
+    A missing directory counts as empty."""
+    try:
+        with os.scandir(directory) as it:
+            return sum(1 for e in it if e.name.endswith(suffix))
+    except OSError:
+        return 0
+
+
 # ── WebSocket Connection Manager ─────────────────────────
 
+async def _send_json(websocket: WebSocket, message: Any) -> None:
+    """websocket.send_json() encoded with _json_body (orjson when installed)."""
+    await websocket.send_text(_json_body(message).decode())
+
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
@@ -94,14 +569,21 @@ class ConnectionManager:
         self.active_connections.discard(websocket)
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.add(connection)
-        self.active_connections -= disconnected
+        """Broadcast message to all connected clients.
+        The message is encoded once and sent to every client concurrently;
+        clients whose send fails are dropped."""
+        connections = list(self.active_connections)
+        if not connections:
+            return
+        text = _json_body(message).decode()
+        results = await asyncio.gather(
+            *(connection.send_text(text) for connection in connections),
+            return_exceptions=True,
+        )
+        self.active_connections.difference_update(
+            connection for connection, result in zip(connections, results)
+            if isinstance(result, Exception)
+        )
 
 
 manager = ConnectionManager()
@@ -152,8 +634,7 @@ DEFAULT_CONFIG = {
 def _load_config() -> Dict[str, Any]:
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE) as f:
-                saved = json.load(f)
+            saved = _load_json(CONFIG_FILE)
             merged = {**DEFAULT_CONFIG, **saved}
             return merged
         except Exception:
@@ -5,13 +5,47 @@ Analyzes agent code to discover capabilities, tools, and potential issues
 """
 
 import ast
+import functools
 import inspect
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import importlib.util
+import re
 import sys
 
 
+# Framework markers, matched case-insensitively in one scan of the source
+_AGENT_TYPE_RE = re.compile(
+    rb"(?P<strands>from strands import agent|strands\.agent)|(?P<langchain>langchain)|(?P<autogpt>autogpt)",
+    re.IGNORECASE,
+)
+# Checked in this order — the first framework present wins
+_AGENT_TYPES = (
+    ("strands", "Strands Agent"),
+    ("langchain", "LangChain Agent"),
+    ("autogpt", "AutoGPT"),
+)
+_CREDENTIALS_RE = re.compile(rb"api_key|password", re.IGNORECASE)
+# Modules whose imports count as tool sources, and (adding crewai) dependencies
+# that are tool packages rather than hard requirements
+_TOOL_MODULE_RE = re.compile(r"tool|amadeus|langchain", re.IGNORECASE)
+_TOOL_PACKAGE_RE = re.compile(r"tool|amadeus|langchain|crewai", re.IGNORECASE)
+# Imports never reported as dependencies
+_SKIP_DEPENDENCIES = frozenset({'os', 'sys', 'json', 'time', 'datetime', 'pathlib'})
+_ENTRY_POINT_NAMES = frozenset({'main', 'run', 'start', 'execute'})
+
+
+@functools.lru_cache(maxsize=None)
+def _module_available(module_name: str) -> bool:
+    """Whether a top-level module can be imported — asks the import finders only,
+    so the module's code is never executed (importing boto3 or langchain just to
+    probe for them costs seconds and may start threads or clients)."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 class AgentDiscovery:
     """
     Discovers agent capabilities by analyzing code
@@ -48,29 +82,24 @@ class AgentDiscovery:
         }
         
         try:
-            # Parse AST
-            with open(self.main_file_path) as f:
+            # Parse AST straight from the bytes — ast.parse honours the PEP 263
+            # coding cookie, and the markers below are matched on bytes too
+            with open(self.main_file_path, "rb") as f:
                 code = f.read()
             
-            tree = ast.parse(code)
+            tree = ast.parse(code, filename=str(self.main_file_path))
             
-            # Discover tools (functions with @tool decorator)
-            result["tools"] = self._find_tools(tree)
-            
-            # Discover functions
-            result["functions"] = self._find_functions(tree)
-            
-            # Discover classes
-            result["classes"] = self._find_classes(tree)
-            
-            # Discover imports
-            result["imports"] = self._find_imports(tree)
+            # One pass over the tree collects tools, functions, classes,
+            # imports and entry points
+            scan = self._scan(tree)
+            result["tools"] = scan["tools"]
+            result["functions"] = scan["functions"]
+            result["classes"] = scan["classes"]
+            result["imports"] = scan["imports"]
+            result["entry_points"] = scan["entry_points"]
             
             # Detect agent type
-            result["agent_type"] = self._detect_agent_type(tree, code)
-            
-            # Find entry points
-            result["entry_points"] = self._find_entry_points(tree)
+            result["agent_type"] = self._detect_agent_type(code, result["classes"])
             
             # Check dependencies
             result["dependencies"] = self._check_dependencies(result["imports"])
@@ -95,95 +124,123 @@ class AgentDiscovery:
         
         return result
     
-    def _find_tools(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Find functions decorated with @tool"""
-        tools = []
+    def _scan(self, tree: ast.AST) -> Dict[str, Any]:
+        """Collect tools, functions, classes, imports and entry points in a single ast.walk().
+
+        ast.walk() is breadth-first, so every list comes out in the same order
+        as a dedicated walk per kind would produce.
+        """
+        tools = []            # @tool decorated functions
+        agent_tools = []      # Agent(tools=[...]) entries
+        package_tools = []    # use_*() registrations
+        tool_imports = []     # imports from tool-like modules
+        functions = []
+        classes = []
+        # dicts as insertion-ordered sets: deduplicated, in source order
+        imports: Dict[str, None] = {}
+        entry_points: Dict[str, None] = {}
         
         for node in ast.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                docstring = ast.get_docstring(node) or ""
+                functions.append({
+                    "name": node.name,
+                    "description": docstring.split('\n')[0] if docstring else "",
+                    "line": node.lineno,
+                    "is_async": isinstance(node, ast.AsyncFunctionDef)
+                })
+                
                 # Check for @tool decorator
-                has_tool_decorator = any(
+                if any(
                     (isinstance(d, ast.Name) and d.id == 'tool') or
                     (isinstance(d, ast.Attribute) and d.attr == 'tool')
                     for d in node.decorator_list
-                )
-                
-                if has_tool_decorator:
-                    # Get docstring
-                    docstring = ast.get_docstring(node) or "No description"
-                    
-                    # Get parameters
-                    params = [arg.arg for arg in node.args.args if arg.arg != 'self']
-                    
+                ):
                     tools.append({
                         "name": node.name,
-                        "description": docstring.split('\n')[0],
-                        "parameters": params,
+                        "description": (docstring or "No description").split('\n')[0],
+                        "parameters": [arg.arg for arg in node.args.args if arg.arg != 'self'],
                         "line": node.lineno
                     })
-        
-        # Also check for external tool imports and usage
-        external_tools = self._find_external_tools(tree)
-        tools.extend(external_tools)
-        
-        return tools
-    
-    def _find_external_tools(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Find tools imported from external packages"""
-        tools = []
-        
-        # Look for tool-related imports
-        tool_imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
-                if node.module and any(keyword in node.module.lower() for keyword in ['tool', 'amadeus', 'langchain']):
-                    for alias in node.names:
-                        tool_imports.append({
-                            "module": node.module,
-                            "name": alias.name,
-                            "line": node.lineno
-                        })
-        
-        # Look for Agent initialization with tools parameter
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                # Check if it's Agent(...) or similar
-                if isinstance(node.func, ast.Name) and node.func.id in ['Agent', 'agent']:
+                
+                if node.name in _ENTRY_POINT_NAMES:
+                    entry_points[node.name] = None
+            
+            elif isinstance(node, ast.ClassDef):
+                docstring = ast.get_docstring(node) or ""
+                classes.append({
+                    "name": node.name,
+                    "description": docstring.split('\n')[0] if docstring else "",
+                    "bases": [self._get_name(base) for base in node.bases],
+                    "line": node.lineno
+                })
+            
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports[alias.name] = None
+            
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    imports[node.module] = None
+                    if _TOOL_MODULE_RE.search(node.module):
+                        for alias in node.names:
+                            tool_imports.append({
+                                "module": node.module,
+                                "name": alias.name,
+                                "line": node.lineno
+                            })
+            
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                func_name = node.func.id
+                # Agent(...) initialization with a tools parameter
+                if func_name in ['Agent', 'agent']:
                     for keyword in node.keywords:
-                        if keyword.arg == 'tools':
-                            # Found tools parameter
-                            if isinstance(keyword.value, ast.List):
-                                for tool in keyword.value.elts:
-                                    tool_name = self._extract_tool_name(tool)
-                                    if tool_name:
-                                        tools.append({
-                                            "name": tool_name,
-                                            "description": "External tool",
-                                            "parameters": [],
-                                            "line": node.lineno,
-                                            "source": "external"
-                                        })
-        
-        # Look for use_* function calls (like use_amadeus())
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                    if func_name.startswith('use_'):
-                        # This is likely a tool registration function
-                        tool_package = func_name.replace('use_', '')
-                        tools.append({
-                            "name": f"{tool_package}_tools",
-                            "description": f"Tools from {tool_package} package",
-                            "parameters": [],
-                            "line": node.lineno,
-                            "source": "package"
-                        })
+                        if keyword.arg == 'tools' and isinstance(keyword.value, ast.List):
+                            for tool in keyword.value.elts:
+                                tool_name = self._extract_tool_name(tool)
+                                if tool_name:
+                                    agent_tools.append({
+                                        "name": tool_name,
+                                        "description": "External tool",
+                                        "parameters": [],
+                                        "line": node.lineno,
+                                        "source": "external"
+                                    })
+                # use_* function calls (like use_amadeus()) register tool packages
+                elif func_name.startswith('use_'):
+                    tool_package = func_name.replace('use_', '')
+                    package_tools.append({
+                        "name": f"{tool_package}_tools",
+                        "description": f"Tools from {tool_package} package",
+                        "parameters": [],
+                        "line": node.lineno,
+                        "source": "package"
+                    })
+            
+            # Check for if __name__ == "__main__"
+            elif isinstance(node, ast.If):
+                if (isinstance(node.test, ast.Compare) and
+                        isinstance(node.test.left, ast.Name) and
+                        node.test.left.id == "__name__" and
+                        len(node.test.comparators) == 1 and
+                        isinstance(node.test.comparators[0], ast.Constant) and
+                        node.test.comparators[0].value == "__main__" and
+                        any(isinstance(op, ast.Eq) for op in node.test.ops)):
+                    entry_points["__main__"] = None
+            
+            # Check for Agent instance
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name) and target.id == 'agent':
+                        entry_points["agent (variable)"] = None
         
-        # Add info from tool imports
+        # External tools, then tool imports not already listed under the same name
+        external_tools = agent_tools + package_tools
+        seen = {t["name"] for t in external_tools}
         for imp in tool_imports:
-            if imp["name"] not in [t["name"] for t in tools]:
-                tools.append({
+            if imp["name"] not in seen:
+                seen.add(imp["name"])
+                external_tools.append({
                     "name": imp["name"],
                     "description": f"Imported from {imp['module']}",
                     "parameters": [],
@@ -191,7 +248,13 @@ class AgentDiscovery:
                     "source": "import"
                 })
         
-        return tools
+        return {
+            "tools": tools + external_tools,
+            "functions": functions,
+            "classes": classes,
+            "imports": list(imports),
+            "entry_points": list(entry_points),
+        }
     
     def _extract_tool_name(self, node: ast.AST) -> Optional[str]:
         """Extract tool name from AST node"""
@@ -202,117 +265,30 @@ class AgentDiscovery:
                 return node.func.id
         return None
     
-    def _find_functions(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Find all functions"""
-        functions = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                docstring = ast.get_docstring(node) or ""
-
-                functions.append({
-                    "name": node.name,
-                    "description": docstring.split('\n')[0] if docstring else "",
-                    "line": node.lineno,
-                    "is_async": isinstance(node, ast.AsyncFunctionDef)
-                })
-        
-        return functions
-    
-    def _find_classes(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Find all classes"""
-        classes = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                docstring = ast.get_docstring(node) or ""
-                
-                # Get base classes
-                bases = [self._get_name(base) for base in node.bases]
-                
-                classes.append({
-                    "name": node.name,
-                    "description": docstring.split('\n')[0] if docstring else "",
-                    "bases": bases,
-                    "line": node.lineno
-                })
-        
-        return classes
-    
-    def _find_imports(self, tree: ast.AST) -> List[str]:
-        """Find all imports"""
-        imports = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-        
-        return list(set(imports))
-    
-    def _detect_agent_type(self, tree: ast.AST, code: str) -> str:
+    def _detect_agent_type(self, code: bytes, classes: List[Dict[str, Any]]) -> str:
         """Detect what type of agent this is"""
-        code_lower = code.lower()
-        
-        # Check for Strands Agent
-        if 'from strands import agent' in code_lower or 'strands.agent' in code_lower:
-            return "Strands Agent"
-        
-        # Check for LangChain
-        if 'langchain' in code_lower:
-            return "LangChain Agent"
-        
-        # Check for AutoGPT
-        if 'autogpt' in code_lower:
-            return "AutoGPT"
+        found = set()
+        for match in _AGENT_TYPE_RE.finditer(code):
+            found.add(match.lastgroup)
+            if match.lastgroup == "strands":
+                break
+        for marker, agent_type in _AGENT_TYPES:
+            if marker in found:
+                return agent_type
         
         # Check for custom agent patterns
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                if 'agent' in node.name.lower():
-                    return "Custom Agent"
+        if any('agent' in c["name"].lower() for c in classes):
+            return "Custom Agent"
         
         return "Unknown"
     
-    def _find_entry_points(self, tree: ast.AST) -> List[str]:
-        """Find possible entry points (main, run, etc.)"""
-        entry_points = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.name in ['main', 'run', 'start', 'execute']:
-                    entry_points.append(node.name)
-
-            # Check for if __name__ == "__main__"
-            if isinstance(node, ast.If):
-                if (isinstance(node.test, ast.Compare) and
-                        isinstance(node.test.left, ast.Name) and
-                        node.test.left.id == "__name__" and
-                        len(node.test.comparators) == 1 and
-                        isinstance(node.test.comparators[0], ast.Constant) and
-                        node.test.comparators[0].value == "__main__" and
-                        any(isinstance(op, ast.Eq) for op in node.test.ops)):
-                    entry_points.append("__main__")
-        
-        # Check for Agent instance
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name) and target.id == 'agent':
-                        entry_points.append("agent (variable)")
-        
-        return list(set(entry_points))
-    
     def _check_dependencies(self, imports: List[str]) -> List[Dict[str, Any]]:
         """Check if dependencies are installed"""
         dependencies = []
         
         for imp in imports:
             # Skip standard library
-            if imp in ['os', 'sys', 'json', 'time', 'datetime', 'pathlib']:
+            if imp in _SKIP_DEPENDENCIES:
                 continue
             
             # Check if it's a local package (exists in agent directory)
@@ -340,11 +316,7 @@ class AgentDiscovery:
                 })
                 continue
             
-            try:
-                importlib.import_module(module_name)
-                status = "installed"
-            except ImportError:
-                status = "missing"
+            status = "installed" if _module_available(module_name) else "missing"
             
             dependencies.append({
                 "name": imp,
@@ -353,7 +325,7 @@ class AgentDiscovery:
         
         return dependencies
     
-    def _analyze_issues(self, tree: ast.AST, code: str, discovery: Dict) -> List[Dict[str, Any]]:
+    def _analyze_issues(self, tree: ast.AST, code: bytes, discovery: Dict) -> List[Dict[str, Any]]:
         """Analyze potential issues"""
         issues = []
         
@@ -361,9 +333,7 @@ class AgentDiscovery:
         missing_deps = [d for d in discovery["dependencies"] if d["status"] == "missing"]
         if missing_deps:
             # Check if these are external tool packages (less critical)
-            external_tool_packages = [d for d in missing_deps if any(
-                keyword in d["name"].lower() for keyword in ['tool', 'amadeus', 'langchain', 'crewai']
-            )]
+            external_tool_packages = [d for d in missing_deps if _TOOL_PACKAGE_RE.search(d["name"])]
             
             critical_missing = [d for d in missing_deps if d not in external_tool_packages]
             
@@ -405,7 +375,7 @@ class AgentDiscovery:
             })
         
         # Check for hardcoded credentials (basic check)
-        if 'api_key' in code.lower() or 'password' in code.lower():
+        if _CREDENTIALS_RE.search(code):
             issues.append({
                 "type": "POTENTIAL_CREDENTIALS",
                 "severity": "MEDIUM",
@@ -5,15 +5,19 @@ Handles both bearer token and IAM credentials authentication.
 """
 
 import os
-from typing import Dict, Any, Optional
-import boto3
-import botocore
-from botocore.config import Config
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+
+# (region, auth mode, credential, secret) -> bedrock-runtime client. Credentials are
+# part of the key so rotating the environment variables yields a fresh client.
+_client_cache: Dict[Tuple[str, str, Optional[str], Optional[str]], Any] = {}
+_client_lock = threading.Lock()
 
 
 def get_bedrock_client(region: Optional[str] = None):
     """
-    Create a Bedrock Runtime client with proper authentication.
+    Get a Bedrock Runtime client with proper authentication.
     
     Supports two authentication methods:
     1. Bearer Token (AWS_BEARER_TOKEN_BEDROCK)
@@ -23,14 +27,38 @@ def get_bedrock_client(region: Optional[str] = None):
         region: AWS region (defaults to AWS_DEFAULT_REGION env var or us-east-1)
     
     Returns:
-        boto3 bedrock-runtime client
+        boto3 bedrock-runtime client (shared by calls with the same region and
+        credentials — building one loads the service model and endpoint rules)
     """
     region = region or os.getenv("AWS_DEFAULT_REGION", "us-east-1")
-    
-    # Check for bearer token first
     bearer_token = os.getenv("AWS_BEARER_TOKEN_BEDROCK")
-    
     if bearer_token:
+        key = (region, "bearer", bearer_token, None)
+    else:
+        key = (region, "iam", os.getenv("AWS_ACCESS_KEY_ID"), os.getenv("AWS_SECRET_ACCESS_KEY"))
+
+    # Clients are thread-safe to use but not to build — construct under the lock
+    with _client_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            client = _build_bedrock_client(*key)
+            _client_cache[key] = client
+        return client
+
+
+def _build_bedrock_client(region: str, auth: str, credential: Optional[str], secret: Optional[str]):
+    """Create a new bedrock-runtime client for the given auth mode and credentials.
+
+    boto3 is imported here, on the first client build, so get_aws_config() and
+    importing this module stay cheap.
+    """
+    import boto3
+    import botocore
+    from botocore.config import Config
+
+    if auth == "bearer":
+        # Built once per client — the hook below runs on every request
+        auth_header = f"Bearer {credential}"
         # Bedrock API Key (bearer token) authentication.
         # Use UNSIGNED to skip SigV4 signing entirely, then inject
         # the Authorization: Bearer header via a botocore event hook.
@@ -46,15 +74,14 @@ def get_bedrock_client(region: Optional[str] = None):
         )
 
         def _inject_bearer(request, **kwargs):
-            request.headers["Authorization"] = f"Bearer {bearer_token}"
+            request.headers["Authorization"] = auth_header
 
         client.meta.events.register("before-send.bedrock-runtime.*", _inject_bearer)
         return client
     
     else:
         # Standard IAM credentials authentication
-        access_key = os.getenv("AWS_ACCESS_KEY_ID")
-        secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+        access_key, secret_key = credential, secret
         
         if not access_key or not secret_key:
             raise ValueError(